@@ -6,11 +6,15 @@ and querying experiments with their configurations, metrics, and results.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import sqlite3
-from datetime import datetime
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any, Concatenate, ParamSpec, TypeVar
 
 from ..models.experiment import (
     Experiment,
@@ -24,6 +28,22 @@ from ..models.experiment import (
 
 logger = logging.getLogger(__name__)
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def _locked(
+    method: Callable[Concatenate[ExperimentDatabase, P], R],
+) -> Callable[Concatenate[ExperimentDatabase, P], R]:
+    """Run a database method while holding the instance's connection lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: ExperimentDatabase, *args: P.args, **kwargs: P.kwargs) -> R:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class ExperimentDatabaseError(Exception):
     """Base exception for experiment database errors."""
@@ -48,6 +68,9 @@ class ExperimentDatabase:
         """
         self.db_path = Path(db_path) if db_path != ":memory:" else db_path
         self._conn: sqlite3.Connection | None = None
+        # The connection is shared across threads (check_same_thread=False);
+        # serialize transactions and multi-query reads on it
+        self._lock = threading.RLock()
         self._initialize_database()
 
     def _get_connection(self) -> sqlite3.Connection:
@@ -128,6 +151,20 @@ class ExperimentDatabase:
         """
         )
 
+        # Create checkpoints table
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS experiment_checkpoints (
+                id TEXT PRIMARY KEY,
+                experiment_id TEXT NOT NULL,
+                name TEXT,
+                path TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                FOREIGN KEY (experiment_id) REFERENCES experiments (id) ON DELETE CASCADE
+            )
+        """
+        )
+
         # Create indexes for better query performance
         conn.execute("CREATE INDEX IF NOT EXISTS idx_experiments_status ON experiments (status)")
         conn.execute(
@@ -149,9 +186,14 @@ class ExperimentDatabase:
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_artifacts_type ON experiment_artifacts (artifact_type)"
         )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_checkpoints_experiment_id "
+            "ON experiment_checkpoints (experiment_id, created_at)"
+        )
 
         conn.commit()
 
+    @_locked
     def save_experiment(self, experiment: Experiment) -> None:
         """Save an experiment to the database.
 
@@ -257,6 +299,7 @@ class ExperimentDatabase:
             logger.error(f"Error saving experiment {experiment.id}: {e}")
             raise ExperimentDatabaseError(f"Failed to save experiment: {e}") from e
 
+    @_locked
     def get_experiment(self, experiment_id: str) -> Experiment | None:
         """Get an experiment by ID.
 
@@ -372,6 +415,23 @@ class ExperimentDatabase:
             logger.error(f"Error loading experiment {experiment_id}: {e}")
             raise ExperimentDatabaseError(f"Failed to load experiment: {e}") from e
 
+    @_locked
+    def get_experiment_updated_at(self, experiment_id: str) -> datetime | None:
+        """Get when an experiment was last updated, without loading it.
+
+        Args:
+            experiment_id: ID of the experiment
+
+        Returns:
+            The stored ``updated_at`` timestamp, or None if the experiment is not found
+        """
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT updated_at FROM experiments WHERE id = ?", (experiment_id,)
+        ).fetchone()
+        return datetime.fromisoformat(row["updated_at"]) if row else None
+
+    @_locked
     def list_experiments(
         self,
         status: ExperimentStatus | None = None,
@@ -444,6 +504,7 @@ class ExperimentDatabase:
 
         return experiments
 
+    @_locked
     def delete_experiment(self, experiment_id: str) -> bool:
         """Delete an experiment and all its data.
 
@@ -471,6 +532,7 @@ class ExperimentDatabase:
             logger.error(f"Error deleting experiment {experiment_id}: {e}")
             raise ExperimentDatabaseError(f"Failed to delete experiment: {e}") from e
 
+    @_locked
     def get_experiment_metrics(
         self, experiment_id: str, metric_name: str | None = None
     ) -> list[ExperimentMetric]:
@@ -511,6 +573,72 @@ class ExperimentDatabase:
 
         return metrics
 
+    @_locked
+    def save_checkpoint(
+        self,
+        checkpoint_id: str,
+        experiment_id: str,
+        path: str | Path,
+        name: str | None = None,
+        created_at: datetime | None = None,
+    ) -> None:
+        """Record a checkpoint in the checkpoint index.
+
+        Args:
+            checkpoint_id: ID of the checkpoint
+            experiment_id: ID of the experiment the checkpoint belongs to
+            path: Directory holding the checkpoint data
+            name: Optional checkpoint name
+            created_at: Creation time (defaults to now)
+        """
+        conn = self._get_connection()
+
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO experiment_checkpoints (
+                    id, experiment_id, name, path, created_at
+                ) VALUES (?, ?, ?, ?, ?)
+            """,
+                (
+                    checkpoint_id,
+                    experiment_id,
+                    name,
+                    str(path),
+                    (created_at or datetime.now(UTC)).isoformat(),
+                ),
+            )
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error saving checkpoint {checkpoint_id}: {e}")
+            raise ExperimentDatabaseError(f"Failed to save checkpoint: {e}") from e
+
+    @_locked
+    def list_checkpoints(self, experiment_id: str | None = None) -> list[dict[str, Any]]:
+        """List indexed checkpoints, oldest first.
+
+        Args:
+            experiment_id: Optional experiment ID to filter by
+
+        Returns:
+            List of checkpoint records with id, experiment_id, name, path and created_at
+        """
+        conn = self._get_connection()
+
+        query = "SELECT * FROM experiment_checkpoints"
+        params = []
+
+        if experiment_id:
+            query += " WHERE experiment_id = ?"
+            params.append(experiment_id)
+
+        query += " ORDER BY created_at, id"
+
+        return [dict(row) for row in conn.execute(query, params).fetchall()]
+
+    @_locked
     def get_experiment_count(
         self,
         status: ExperimentStatus | None = None,
@@ -7,10 +7,15 @@ result tracking during evolution runs.
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import copy
+import functools
 import logging
 import traceback
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple, TypeVar
 
 from ..models.experiment import (
     Experiment,
@@ -23,6 +28,16 @@ from .version_tracker import VersionTracker
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class PerfRow(NamedTuple):
+    """Performance metrics recorded for a single iteration."""
+
+    execution_time: float
+    memory_usage: float
+    cpu_usage: float
+
 
 class ExperimentIntegration:
     """Integrates experiment tracking with the evolution pipeline."""
@@ -51,6 +66,12 @@ class ExperimentIntegration:
         self._iteration_count = 0
         self._generation_count = 0
 
+        # experiment_id -> (revision, summary) for finished experiments; see
+        # _summary_revision for what invalidates an entry
+        self._summary_cache: dict[str, tuple[tuple[Any, int], dict[str, Any]]] = {}
+        # Single worker so flushed writes keep their submission order
+        self._flush_pool: concurrent.futures.ThreadPoolExecutor | None = None
+
     def create_evolution_experiment(
         self,
         name: str,
@@ -238,53 +259,37 @@ class ExperimentIntegration:
         if not self.current_experiment or not self.track_metrics:
             return
 
-        # Track completion
-        self.current_experiment.add_metric(
-            name="iteration_completed",
-            value=iteration,
-            metric_type=MetricType.CUSTOM,
-            iteration=iteration,
-        )
+        self._record_iteration_metrics(iteration, fitness_scores, best_fitness, metrics)
 
-        # Track fitness metrics
-        if fitness_scores:
-            self.current_experiment.add_metric(
-                name="population_fitness_avg",
-                value=sum(fitness_scores) / len(fitness_scores),
-                metric_type=MetricType.CUSTOM,
-                iteration=iteration,
-            )
+        # Save experiment
+        self.version_tracker.experiment_db.save_experiment(self.current_experiment)
 
-            self.current_experiment.add_metric(
-                name="population_fitness_max",
-                value=max(fitness_scores),
-                metric_type=MetricType.CUSTOM,
-                iteration=iteration,
-            )
+    def track_iteration(
+        self,
+        iteration: int,
+        fitness_scores: list[float] | None = None,
+        best_fitness: float | None = None,
+        performance_metrics: dict[str, Any] | None = None,
+        **metrics: Any,
+    ) -> None:
+        """Track iteration completion and performance metrics with a single save.
 
-            self.current_experiment.add_metric(
-                name="population_fitness_min",
-                value=min(fitness_scores),
-                metric_type=MetricType.CUSTOM,
-                iteration=iteration,
-            )
+        Equivalent to calling :meth:`track_iteration_complete` followed by
+        :meth:`track_performance_metrics`, but persists the experiment once.
 
-        if best_fitness is not None:
-            self.current_experiment.add_metric(
-                name="best_fitness",
-                value=best_fitness,
-                metric_type=MetricType.CUSTOM,
-                iteration=iteration,
-            )
+        Args:
+            iteration: Iteration number
+            fitness_scores: List of fitness scores for the population
+            best_fitness: Best fitness score in this iteration
+            performance_metrics: Performance metrics to track for this iteration
+            **metrics: Additional metrics to track
+        """
+        if not self.current_experiment or not self.track_metrics:
+            return
 
-        # Track additional metrics
-        for metric_name, value in metrics.items():
-            self.current_experiment.add_metric(
-                name=metric_name,
-                value=value,
-                metric_type=MetricType.CUSTOM,
-                iteration=iteration,
-            )
+        self._record_iteration_metrics(iteration, fitness_scores, best_fitness, metrics)
+        if performance_metrics:
+            self._record_performance_metrics(performance_metrics, iteration)
 
         # Save experiment
         self.version_tracker.experiment_db.save_experiment(self.current_experiment)
@@ -344,24 +349,33 @@ class ExperimentIntegration:
         if not self.current_experiment or not self.track_metrics:
             return
 
-        for metric_name, value in metrics.items():
-            # Determine metric type based on name
-            metric_type = MetricType.CUSTOM
-            if "time" in metric_name.lower():
-                metric_type = MetricType.EXECUTION_TIME
-            elif "memory" in metric_name.lower():
-                metric_type = MetricType.MEMORY_USAGE
-            elif "accuracy" in metric_name.lower():
-                metric_type = MetricType.ACCURACY
-            elif "loss" in metric_name.lower():
-                metric_type = MetricType.LOSS
+        self._record_performance_metrics(metrics, self._iteration_count)
 
-            self.current_experiment.add_metric(
-                name=metric_name,
-                value=value,
-                metric_type=metric_type,
-                iteration=self._iteration_count,
-            )
+        # Save experiment
+        self.version_tracker.experiment_db.save_experiment(self.current_experiment)
+
+    def track_performance_metrics_bulk(
+        self, rows: Iterable[Sequence[float]], start_iteration: int = 1
+    ) -> None:
+        """Track performance metrics for consecutive iterations with a single save.
+
+        Args:
+            rows: One row per iteration with values in :class:`PerfRow` field
+                order, e.g. ``PerfRow`` instances or a 2-D array
+            start_iteration: Iteration number of the first row
+        """
+        if not self.current_experiment or not self.track_metrics:
+            return
+
+        metric_types = [self._performance_metric_type(name) for name in PerfRow._fields]
+        for iteration, row in enumerate(rows, start=start_iteration):
+            for name, metric_type, value in zip(PerfRow._fields, metric_types, row, strict=True):
+                self.current_experiment.add_metric(
+                    name=name,
+                    value=float(value),
+                    metric_type=metric_type,
+                    iteration=iteration,
+                )
 
         # Save experiment
         self.version_tracker.experiment_db.save_experiment(self.current_experiment)
@@ -423,9 +437,34 @@ class ExperimentIntegration:
 
         return artifact.id
 
+    def add_artifacts(self, artifacts: list[dict[str, Any]]) -> list[str]:
+        """Add several artifacts to the current experiment with a single save.
+
+        Args:
+            artifacts: Artifact specifications, each holding the keyword
+                arguments accepted by :meth:`add_artifact`
+
+        Returns:
+            List of artifact IDs, in the order given
+        """
+        if not self.current_experiment:
+            return []
+
+        artifact_ids = [
+            self.current_experiment.add_artifact(**artifact).id for artifact in artifacts
+        ]
+
+        # Save experiment
+        self.version_tracker.experiment_db.save_experiment(self.current_experiment)
+
+        return artifact_ids
+
     def get_experiment_summary(self, experiment_id: str | None = None) -> dict[str, Any]:
         """Get a summary of an experiment.
 
+        Summaries of finished experiments are cached until the stored experiment
+        is updated (by any writer) or gains variants.
+
         Args:
             experiment_id: Optional experiment ID (uses current if not provided)
 
@@ -433,6 +472,9 @@ class ExperimentIntegration:
             Experiment summary
         """
         if experiment_id:
+            cached = self._summary_cache.get(experiment_id)
+            if cached and cached[0] == self._summary_revision(experiment_id):
+                return copy.deepcopy(cached[1])
             experiment = self.version_tracker.experiment_db.get_experiment(experiment_id)
         elif self.current_experiment:
             experiment = self.current_experiment
@@ -442,6 +484,28 @@ class ExperimentIntegration:
         if not experiment:
             raise ValueError(f"Experiment {experiment_id} not found")
 
+        summary = self._build_experiment_summary(experiment)
+
+        # Running experiments report a live duration, so only cache finished ones
+        if experiment.completed_at:
+            revision = (
+                experiment.updated_at,
+                self.version_tracker.version_db.get_experiment_revision(experiment.id),
+            )
+            self._summary_cache[experiment.id] = (revision, copy.deepcopy(summary))
+
+        return summary
+
+    def _summary_revision(self, experiment_id: str) -> tuple[Any, int]:
+        """Cheap fingerprint of the data a stored experiment's summary is built from."""
+        return (
+            self.version_tracker.experiment_db.get_experiment_updated_at(experiment_id),
+            self.version_tracker.version_db.get_experiment_revision(experiment_id),
+        )
+
+    def _build_experiment_summary(self, experiment: Experiment) -> dict[str, Any]:
+        """Build the summary dictionary for an experiment."""
+
         # Get variant statistics
         variant_stats = self.version_tracker.version_db.get_variant_statistics(experiment.id)
 
@@ -471,6 +535,115 @@ class ExperimentIntegration:
             "total_metrics": len(experiment.metrics),
         }
 
+    async def aflush(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking tracking call in the background flush thread.
+
+        Lets the event loop keep running other tasks while the database and
+        artifact writes of ``fn`` (e.g. :meth:`add_artifacts` or
+        :meth:`create_checkpoint`) are in progress. Calls are executed one at
+        a time, in the order they were submitted.
+
+        Args:
+            fn: Blocking callable to run, usually a method of this integration
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            The return value of ``fn``
+        """
+        if self._flush_pool is None:
+            self._flush_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="experiment-flush"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._flush_pool, functools.partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        """Shut down the background flush thread, waiting for pending writes."""
+        if self._flush_pool is not None:
+            self._flush_pool.shutdown(wait=True)
+            self._flush_pool = None
+
+    def _record_iteration_metrics(
+        self,
+        iteration: int,
+        fitness_scores: list[float] | None,
+        best_fitness: float | None,
+        metrics: dict[str, Any],
+    ) -> None:
+        """Add iteration completion metrics to the current experiment without saving."""
+        # Track completion
+        self.current_experiment.add_metric(
+            name="iteration_completed",
+            value=iteration,
+            metric_type=MetricType.CUSTOM,
+            iteration=iteration,
+        )
+
+        # Track fitness metrics
+        if fitness_scores:
+            self.current_experiment.add_metric(
+                name="population_fitness_avg",
+                value=sum(fitness_scores) / len(fitness_scores),
+                metric_type=MetricType.CUSTOM,
+                iteration=iteration,
+            )
+
+            self.current_experiment.add_metric(
+                name="population_fitness_max",
+                value=max(fitness_scores),
+                metric_type=MetricType.CUSTOM,
+                iteration=iteration,
+            )
+
+            self.current_experiment.add_metric(
+                name="population_fitness_min",
+                value=min(fitness_scores),
+                metric_type=MetricType.CUSTOM,
+                iteration=iteration,
+            )
+
+        if best_fitness is not None:
+            self.current_experiment.add_metric(
+                name="best_fitness",
+                value=best_fitness,
+                metric_type=MetricType.CUSTOM,
+                iteration=iteration,
+            )
+
+        # Track additional metrics
+        for metric_name, value in metrics.items():
+            self.current_experiment.add_metric(
+                name=metric_name,
+                value=value,
+                metric_type=MetricType.CUSTOM,
+                iteration=iteration,
+            )
+
+    def _record_performance_metrics(self, metrics: dict[str, Any], iteration: int) -> None:
+        """Add performance metrics to the current experiment without saving."""
+        for metric_name, value in metrics.items():
+            self.current_experiment.add_metric(
+                name=metric_name,
+                value=value,
+                metric_type=self._performance_metric_type(metric_name),
+                iteration=iteration,
+            )
+
+    @staticmethod
+    def _performance_metric_type(metric_name: str) -> MetricType:
+        """Determine a performance metric's type based on its name."""
+        name = metric_name.lower()
+        if "time" in name:
+            return MetricType.EXECUTION_TIME
+        if "memory" in name:
+            return MetricType.MEMORY_USAGE
+        if "accuracy" in name:
+            return MetricType.ACCURACY
+        if "loss" in name:
+            return MetricType.LOSS
+        return MetricType.CUSTOM
+
     def _convert_to_experiment_config(self, config: dict[str, Any]) -> ExperimentConfig:
         """Convert a configuration dictionary to ExperimentConfig.
 
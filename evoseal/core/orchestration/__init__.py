@@ -8,7 +8,7 @@ including checkpointing, state persistence, recovery strategies, and execution f
 from .checkpoint_manager import CheckpointManager, CheckpointMetadata, CheckpointType
 from .orchestrator import WorkflowOrchestrator
 from .recovery_manager import RecoveryManager, RecoveryStrategy
-from .resource_monitor import ResourceMonitor
+from .resource_monitor import ResourceMonitor, ResourceThresholds
 from .types import ExecutionContext, ExecutionStrategy, OrchestrationState, WorkflowStep
 
 __all__ = [
@@ -19,6 +19,7 @@ __all__ = [
     "RecoveryManager",
     "RecoveryStrategy",
     "ResourceMonitor",
+    "ResourceThresholds",
     "OrchestrationState",
     "ExecutionStrategy",
     "WorkflowStep",
@@ -6,13 +6,15 @@ Handles creation, storage, retrieval, and management of workflow checkpoints.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import pickle  # nosec B403 - Used safely for checkpoint serialization in controlled environment
 import time
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -38,6 +40,7 @@ class CheckpointMetadata:
     cpu_usage: float
     experiment_id: str | None = None
     version_id: str | None = None
+    base_checkpoint_id: str | None = None
     custom_metadata: dict[str, Any] = field(default_factory=dict)
 
 
@@ -47,20 +50,43 @@ class CheckpointManager:
 
     Provides functionality to create, store, retrieve, and manage checkpoints
     throughout the workflow execution lifecycle.
+
+    Step results are checkpointed incrementally: a checkpoint only stores the
+    step results whose content changed since the previous checkpoint and points
+    at that checkpoint through ``base_checkpoint_id``. Every
+    ``full_snapshot_interval`` checkpoints a full snapshot is written so the
+    chain folded by :meth:`get_checkpoint` stays short.
+
+    Checkpoint files are written by a background task so that serialization
+    and disk I/O stay off the workflow's critical path; call :meth:`flush` to
+    wait until everything queued so far is on disk.
     """
 
-    def __init__(self, checkpoint_dir: Path):
+    def __init__(self, checkpoint_dir: Path, full_snapshot_interval: int = 10):
         """Initialize the checkpoint manager.
 
         Args:
             checkpoint_dir: Directory for storing checkpoint files
+            full_snapshot_interval: Number of checkpoints between full snapshots
+                of the step results (1 disables delta checkpoints)
         """
         self.checkpoint_dir = checkpoint_dir
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.full_snapshot_interval = max(1, full_snapshot_interval)
 
         # In-memory checkpoint registry
         self.checkpoints: dict[str, CheckpointMetadata] = {}
 
+        # Delta tracking: content hash of each step result as of the last checkpoint
+        self._result_hashes: dict[str, bytes] = {}
+        self._last_checkpoint_id: str | None = None
+        self._deltas_since_snapshot = 0
+
+        # Background writer: checkpoint_id -> (json data, binary data) not yet on disk
+        self._pending_writes: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+        self._write_queue: asyncio.Queue[str] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+
         # Load existing checkpoints
         self._load_existing_checkpoints()
 
@@ -126,6 +152,30 @@ class CheckpointManager:
         """
         checkpoint_id = f"checkpoint_{int(time.time())}_{uuid.uuid4().hex[:8]}"
 
+        # Only persist step results that changed since the previous checkpoint
+        result_hashes = {
+            step_id: self._hash_result(result) for step_id, result in step_results.items()
+        }
+        full_snapshot = (
+            self._last_checkpoint_id is None
+            or self._last_checkpoint_id not in self.checkpoints
+            or self._deltas_since_snapshot + 1 >= self.full_snapshot_interval
+        )
+        if full_snapshot:
+            base_checkpoint_id = None
+            changed_results = dict(step_results)
+            removed_steps: list[str] = []
+        else:
+            base_checkpoint_id = self._last_checkpoint_id
+            changed_results = {
+                step_id: result
+                for step_id, result in step_results.items()
+                if self._result_hashes.get(step_id) != result_hashes[step_id]
+            }
+            removed_steps = [
+                step_id for step_id in self._result_hashes if step_id not in step_results
+            ]
+
         # Create checkpoint metadata
         metadata = CheckpointMetadata(
             checkpoint_id=checkpoint_id,
@@ -140,6 +190,7 @@ class CheckpointManager:
             memory_usage=resource_usage.get("memory_percent", 0),
             cpu_usage=resource_usage.get("cpu_percent", 0),
             experiment_id=execution_context.experiment_id,
+            base_checkpoint_id=base_checkpoint_id,
             custom_metadata=custom_metadata or {},
         )
 
@@ -148,11 +199,79 @@ class CheckpointManager:
             "metadata": self._serialize_metadata(metadata),
             "execution_context": self._serialize_execution_context(execution_context),
             "workflow_steps": [self._serialize_step(step) for step in workflow_steps],
-            "step_results": step_results,
+            "step_results": changed_results,
+            "removed_steps": removed_steps,
             "state": state.value,
             "created_at": datetime.utcnow().isoformat(),
         }
 
+        # Hand the files to the background writer
+        binary_data = {
+            "step_results": changed_results,
+            "custom_state": custom_metadata or {},
+        }
+        write_queue = self._ensure_writer()
+        self._pending_writes[checkpoint_id] = (checkpoint_data, binary_data)
+        write_queue.put_nowait(checkpoint_id)
+
+        self._result_hashes = result_hashes
+        self._last_checkpoint_id = checkpoint_id
+        self._deltas_since_snapshot = 0 if full_snapshot else self._deltas_since_snapshot + 1
+
+        # Store in memory registry
+        self.checkpoints[checkpoint_id] = metadata
+
+        logger.info(f"Created checkpoint: {checkpoint_id} (type: {checkpoint_type.value})")
+        return checkpoint_id
+
+    def _ensure_writer(self) -> asyncio.Queue[str]:
+        """Return the write queue, starting a writer task on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._write_queue is None
+            or self._writer_task is None
+            or self._writer_task.done()
+            or self._writer_task.get_loop() is not loop
+        ):
+            self._write_queue = asyncio.Queue()
+            self._writer_task = loop.create_task(self._drain_writes())
+            # Re-queue anything a writer on a previous event loop never got to
+            for checkpoint_id in self._pending_writes:
+                self._write_queue.put_nowait(checkpoint_id)
+        return self._write_queue
+
+    async def _drain_writes(self) -> None:
+        """Write queued checkpoints to disk in a worker thread, in creation order."""
+        queue = self._write_queue
+        while True:
+            checkpoint_id = await queue.get()
+            try:
+                await self._write_queued_checkpoint(checkpoint_id)
+            except Exception as e:
+                logger.error(f"Failed to write checkpoint {checkpoint_id}: {e}")
+            finally:
+                queue.task_done()
+
+    async def _write_queued_checkpoint(self, checkpoint_id: str) -> None:
+        """Write one queued checkpoint's files unless it has already been handled."""
+        pending = self._pending_writes.get(checkpoint_id)
+        if pending is None:
+            return
+        try:
+            await asyncio.to_thread(self._write_checkpoint_files, checkpoint_id, *pending)
+        finally:
+            self._pending_writes.pop(checkpoint_id, None)
+        if checkpoint_id not in self.checkpoints:
+            # Deleted while the write was in flight
+            self._remove_checkpoint_files(checkpoint_id)
+
+    def _write_checkpoint_files(
+        self,
+        checkpoint_id: str,
+        checkpoint_data: dict[str, Any],
+        binary_data: dict[str, Any],
+    ) -> None:
+        """Serialize and save a checkpoint's JSON and binary files."""
         # Save checkpoint to JSON file
         checkpoint_file = self.checkpoint_dir / f"{checkpoint_id}.json"
         with open(checkpoint_file, "w") as f:
@@ -161,19 +280,33 @@ class CheckpointManager:
         # Save binary state for complex objects
         binary_file = self.checkpoint_dir / f"{checkpoint_id}.pkl"
         with open(binary_file, "wb") as f:
-            pickle.dump(  # nosec B301 - Serializing trusted checkpoint data
-                {
-                    "step_results": step_results,
-                    "custom_state": custom_metadata or {},
-                },
-                f,
-            )
-
-        # Store in memory registry
-        self.checkpoints[checkpoint_id] = metadata
-
-        logger.info(f"Created checkpoint: {checkpoint_id} (type: {checkpoint_type.value})")
-        return checkpoint_id
+            pickle.dump(binary_data, f)  # nosec B301 - Serializing trusted checkpoint data
+
+    async def flush(self) -> None:
+        """Wait until every checkpoint created so far has been written to disk."""
+        if self._pending_writes:
+            await self._ensure_writer().join()
+
+    async def close(self) -> None:
+        """Flush pending checkpoint writes and stop the background writer."""
+        await self.flush()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+            self._writer_task = None
+            self._write_queue = None
+
+    @staticmethod
+    def _hash_result(result: Any) -> bytes:
+        """Return a content hash of a step result, used to detect changes."""
+        try:
+            payload = pickle.dumps(result)  # nosec B301 - Hashing trusted checkpoint data
+        except Exception:
+            payload = repr(result).encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
 
     def _serialize_metadata(self, metadata: CheckpointMetadata) -> dict[str, Any]:
         """Serialize checkpoint metadata for JSON storage."""
@@ -191,6 +324,7 @@ class CheckpointManager:
             "cpu_usage": metadata.cpu_usage,
             "experiment_id": metadata.experiment_id,
             "version_id": metadata.version_id,
+            "base_checkpoint_id": metadata.base_checkpoint_id,
             "custom_metadata": metadata.custom_metadata,
         }
 
@@ -221,12 +355,58 @@ class CheckpointManager:
     def get_checkpoint(self, checkpoint_id: str) -> dict[str, Any] | None:
         """Retrieve a checkpoint by ID.
 
+        Delta checkpoints are folded onto their base checkpoints, so the returned
+        ``step_results`` (and ``binary_data["step_results"]``) are always complete.
+
         Args:
             checkpoint_id: ID of the checkpoint to retrieve
 
         Returns:
             Checkpoint data or None if not found
         """
+        checkpoint_data = self._load_checkpoint_files(checkpoint_id)
+        if checkpoint_data is None:
+            return None
+
+        # Walk back to the last full snapshot, then replay the deltas oldest first
+        chain = [checkpoint_data]
+        base_id = checkpoint_data.get("metadata", {}).get("base_checkpoint_id")
+        while base_id:
+            base_data = self._load_checkpoint_files(base_id)
+            if base_data is None:
+                logger.warning(
+                    f"Base checkpoint {base_id} of {checkpoint_id} is missing; "
+                    "step results may be incomplete"
+                )
+                break
+            chain.append(base_data)
+            base_id = base_data.get("metadata", {}).get("base_checkpoint_id")
+
+        if len(chain) > 1:
+            step_results: dict[str, Any] = {}
+            binary_results: dict[str, Any] = {}
+            for data in reversed(chain):
+                for step_id in data.get("removed_steps", []):
+                    step_results.pop(step_id, None)
+                    binary_results.pop(step_id, None)
+                step_results.update(data.get("step_results", {}))
+                binary_results.update(data.get("binary_data", {}).get("step_results", {}))
+            checkpoint_data["step_results"] = step_results
+            if "binary_data" in checkpoint_data:
+                checkpoint_data["binary_data"]["step_results"] = binary_results
+
+        return checkpoint_data
+
+    def _load_checkpoint_files(self, checkpoint_id: str) -> dict[str, Any] | None:
+        """Load a single checkpoint's JSON and binary files without folding deltas."""
+        pending = self._pending_writes.get(checkpoint_id)
+        if pending is not None:
+            # Not written yet: return what the files will contain
+            checkpoint_data, binary_data = pending
+            checkpoint_data = json.loads(json.dumps(checkpoint_data, default=str))
+            checkpoint_data["binary_data"] = dict(binary_data)
+            return checkpoint_data
+
         checkpoint_file = self.checkpoint_dir / f"{checkpoint_id}.json"
 
         if not checkpoint_file.exists():
@@ -294,15 +474,8 @@ class CheckpointManager:
             True if deleted successfully
         """
         try:
-            # Remove files
-            checkpoint_file = self.checkpoint_dir / f"{checkpoint_id}.json"
-            binary_file = self.checkpoint_dir / f"{checkpoint_id}.pkl"
-
-            if checkpoint_file.exists():
-                checkpoint_file.unlink()
-
-            if binary_file.exists():
-                binary_file.unlink()
+            self._pending_writes.pop(checkpoint_id, None)
+            self._remove_checkpoint_files(checkpoint_id)
 
             # Remove from memory registry
             if checkpoint_id in self.checkpoints:
@@ -315,6 +488,17 @@ class CheckpointManager:
             logger.error(f"Failed to delete checkpoint {checkpoint_id}: {e}")
             return False
 
+    def _remove_checkpoint_files(self, checkpoint_id: str) -> None:
+        """Remove a checkpoint's files from disk if they exist."""
+        checkpoint_file = self.checkpoint_dir / f"{checkpoint_id}.json"
+        binary_file = self.checkpoint_dir / f"{checkpoint_id}.pkl"
+
+        if checkpoint_file.exists():
+            checkpoint_file.unlink()
+
+        if binary_file.exists():
+            binary_file.unlink()
+
     def cleanup_old_checkpoints(
         self,
         max_age_days: int = 30,
@@ -358,6 +542,18 @@ class CheckpointManager:
                     ):
                         to_delete.append(checkpoint.checkpoint_id)
 
+        # Never delete a checkpoint that a kept delta checkpoint is built on
+        required: set[str] = set()
+        for checkpoint in all_checkpoints:
+            if checkpoint.checkpoint_id in to_delete:
+                continue
+            base_id = checkpoint.base_checkpoint_id
+            while base_id and base_id not in required:
+                required.add(base_id)
+                base = self.checkpoints.get(base_id)
+                base_id = base.base_checkpoint_id if base else None
+        to_delete = [checkpoint_id for checkpoint_id in to_delete if checkpoint_id not in required]
+
         # Perform deletions
         for checkpoint_id in to_delete:
             if self.delete_checkpoint(checkpoint_id):
@@ -8,12 +8,19 @@ for comprehensive workflow execution management.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import heapq
+import inspect
 import logging
+import pickle  # nosec B403 - Only used to hash step parameters
 import time
 import uuid
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime
+from graphlib import TopologicalSorter
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
@@ -42,6 +49,54 @@ from .types import (
 logger = logging.getLogger(__name__)
 
 
+class _ExecutionPlan(NamedTuple):
+    """Dependency structure of a workflow, derived once from its static step list."""
+
+    steps: dict[str, WorkflowStep]
+    order: list[str]  # topological order, ties broken by declaration order
+    deps: dict[str, tuple[str, ...]]
+    fanout: dict[str, int]  # number of direct and transitive dependents
+    rank: dict[str, tuple[int, int, int]]  # parallel dispatch key, lowest first
+
+
+def _compile_plan(steps: list[WorkflowStep]) -> _ExecutionPlan:
+    """Build the execution plan for a validated (acyclic) list of workflow steps."""
+    step_map = {step.step_id: step for step in steps}
+    deps = {step.step_id: tuple(step.dependencies) for step in steps}
+    dependents: dict[str, list[str]] = {step_id: [] for step_id in step_map}
+    for step_id, step_deps in deps.items():
+        for dep in step_deps:
+            dependents[dep].append(step_id)
+
+    # Kahn's algorithm
+    in_degree = {step_id: len(step_deps) for step_id, step_deps in deps.items()}
+    queue = deque(step_id for step_id, degree in in_degree.items() if degree == 0)
+    order = []
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        for neighbor in dependents[current]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    # Walking the topological order backwards sees every dependent before its dependency
+    reachable: dict[str, set[str]] = {}
+    for step_id in reversed(order):
+        found: set[str] = set()
+        for child in dependents[step_id]:
+            found.add(child)
+            found |= reachable[child]
+        reachable[step_id] = found
+    fanout = {step_id: len(reachable.get(step_id, ())) for step_id in step_map}
+
+    rank = {
+        step.step_id: (-fanout[step.step_id], -step.priority, index)
+        for index, step in enumerate(steps)
+    }
+    return _ExecutionPlan(step_map, order, deps, fanout, rank)
+
+
 class WorkflowOrchestrator:
     """
     Main workflow orchestrator for EVOSEAL pipeline.
@@ -58,6 +113,9 @@ class WorkflowOrchestrator:
         recovery_strategy: RecoveryStrategy | None = None,
         resource_thresholds: ResourceThresholds | None = None,
         monitoring_interval: float = 30.0,
+        max_concurrent_steps: int | None = None,
+        resource_monitor: ResourceMonitor | None = None,
+        clock: Callable[[], float] = time.perf_counter,
     ):
         """Initialize the workflow orchestrator.
 
@@ -68,10 +126,18 @@ class WorkflowOrchestrator:
             recovery_strategy: Strategy for handling failures and recovery
             resource_thresholds: Thresholds for resource monitoring
             monitoring_interval: Interval for resource monitoring (seconds)
+            max_concurrent_steps: Maximum number of steps run at once by the parallel
+                strategy (unbounded if None)
+            resource_monitor: Shared, externally started monitor to use instead of
+                creating one; resource_thresholds and monitoring_interval are then ignored
+                and the orchestrator only subscribes to its alerts while a workflow runs
+            clock: Monotonic clock (seconds) used for all reported execution times
         """
         self.workspace_dir = Path(workspace_dir)
         self.checkpoint_interval = checkpoint_interval
         self.execution_strategy = execution_strategy
+        self.max_concurrent_steps = max_concurrent_steps
+        self.clock = clock
 
         # Initialize directories
         self.workspace_dir.mkdir(exist_ok=True)
@@ -85,7 +151,8 @@ class WorkflowOrchestrator:
         self.recovery_manager = RecoveryManager(
             recovery_strategy or RecoveryStrategy(), self.checkpoint_manager
         )
-        self.resource_monitor = ResourceMonitor(
+        self._owns_resource_monitor = resource_monitor is None
+        self.resource_monitor = resource_monitor or ResourceMonitor(
             resource_thresholds or ResourceThresholds(), monitoring_interval
         )
 
@@ -94,6 +161,8 @@ class WorkflowOrchestrator:
         self.execution_context: ExecutionContext | None = None
         self.workflow_steps: list[WorkflowStep] = []
         self.step_results: dict[str, StepResult] = {}
+        self._plan: _ExecutionPlan | None = None
+        self._step_cache: dict[bytes, Any] = {}
 
         # Initialize components
         self.console = Console()
@@ -105,8 +174,23 @@ class WorkflowOrchestrator:
 
     def _register_event_handlers(self) -> None:
         """Register event handlers for orchestration events."""
-        # Add resource monitoring alert callback
-        self.resource_monitor.add_alert_callback(self._on_resource_alert)
+        # Add resource monitoring alert callback (a shared monitor is subscribed per workflow)
+        if self._owns_resource_monitor:
+            self.resource_monitor.add_alert_callback(self._on_resource_alert)
+
+    async def _start_resource_monitoring(self) -> None:
+        """Start our own resource monitor, or subscribe to the shared one."""
+        if self._owns_resource_monitor:
+            await self.resource_monitor.start_monitoring()
+        elif self._on_resource_alert not in self.resource_monitor.alert_callbacks:
+            self.resource_monitor.add_alert_callback(self._on_resource_alert)
+
+    async def _stop_resource_monitoring(self) -> None:
+        """Stop our own resource monitor, or unsubscribe from the shared one."""
+        if self._owns_resource_monitor:
+            await self.resource_monitor.stop_monitoring()
+        elif self._on_resource_alert in self.resource_monitor.alert_callbacks:
+            self.resource_monitor.remove_alert_callback(self._on_resource_alert)
 
     async def initialize_workflow(
         self,
@@ -122,6 +206,7 @@ class WorkflowOrchestrator:
         """
         try:
             self.state = OrchestrationState.INITIALIZING
+            self._step_cache.clear()
 
             # Parse workflow configuration
             workflow_id = workflow_config.get("workflow_id", str(uuid.uuid4()))
@@ -149,9 +234,10 @@ class WorkflowOrchestrator:
             # Validate workflow
             if not self._validate_workflow():
                 raise ValueError("Workflow validation failed")
+            self._plan = _compile_plan(self.workflow_steps)
 
             # Start resource monitoring
-            await self.resource_monitor.start_monitoring()
+            await self._start_resource_monitoring()
 
             # Publish initialization event
             await event_bus.publish(
@@ -160,6 +246,7 @@ class WorkflowOrchestrator:
                     new_state="initialized",
                     entity_type="workflow",
                     entity_id=workflow_id,
+                    source="workflow_orchestrator",
                 )
             )
 
@@ -172,9 +259,10 @@ class WorkflowOrchestrator:
             self.state = OrchestrationState.FAILED
             await event_bus.publish(
                 create_error_event(
-                    error_type="initialization_error",
-                    error_message=str(e),
+                    error=e,
+                    source="workflow_orchestrator",
                     severity="critical",
+                    error_type="initialization_error",
                 )
             )
             return False
@@ -184,7 +272,7 @@ class WorkflowOrchestrator:
         steps = []
         for step_config in steps_config:
             step = WorkflowStep(
-                step_id=step_config.get("step_id", str(uuid.uuid4())),
+                step_id=step_config.get("step_id", step_config["name"]),
                 name=step_config["name"],
                 component=step_config["component"],
                 operation=step_config["operation"],
@@ -196,6 +284,7 @@ class WorkflowOrchestrator:
                 critical=step_config.get("critical", True),
                 parallel_group=step_config.get("parallel_group"),
                 priority=step_config.get("priority", 0),
+                cacheable=step_config.get("cacheable", False),
             )
             steps.append(step)
         return steps
@@ -206,13 +295,20 @@ class WorkflowOrchestrator:
             logger.error("No workflow steps defined")
             return False
 
+        # Step ids key the execution plan, so they must be unique
+        step_ids: set[str] = set()
+        for step in self.workflow_steps:
+            if step.step_id in step_ids:
+                logger.error(f"Duplicate step id '{step.step_id}' in workflow")
+                return False
+            step_ids.add(step.step_id)
+
         # Check for circular dependencies
         if self._has_circular_dependencies():
             logger.error("Circular dependencies detected in workflow")
             return False
 
         # Validate step references
-        step_ids = {step.step_id for step in self.workflow_steps}
         for step in self.workflow_steps:
             for dep in step.dependencies:
                 if dep not in step_ids:
@@ -273,6 +369,9 @@ class WorkflowOrchestrator:
             raise RuntimeError("Workflow not initialized")
 
         start_time = datetime.utcnow()
+        clock_start = self.clock()
+        # Cached step results never outlive the execution that produced them
+        self._step_cache.clear()
 
         try:
             # Handle resume from checkpoint
@@ -291,7 +390,7 @@ class WorkflowOrchestrator:
                 experiment_id=self.execution_context.experiment_id,
                 start_time=start_time,
                 end_time=datetime.utcnow(),
-                total_execution_time=(datetime.utcnow() - start_time).total_seconds(),
+                total_execution_time=self.clock() - clock_start,
                 iterations=iterations,
                 success_count=sum(1 for it in iterations if it.success),
                 failure_count=sum(1 for it in iterations if not it.success),
@@ -313,7 +412,7 @@ class WorkflowOrchestrator:
                 experiment_id=self.execution_context.experiment_id,
                 start_time=start_time,
                 end_time=datetime.utcnow(),
-                total_execution_time=(datetime.utcnow() - start_time).total_seconds(),
+                total_execution_time=self.clock() - clock_start,
                 iterations=[],
                 success_count=0,
                 failure_count=1,
@@ -406,6 +505,7 @@ class WorkflowOrchestrator:
     ) -> IterationResult:
         """Execute a single workflow iteration."""
         iteration_start = datetime.utcnow()
+        iteration_clock_start = self.clock()
 
         try:
             # Update context
@@ -417,6 +517,7 @@ class WorkflowOrchestrator:
                     current=iteration,
                     total=self.execution_context.total_iterations,
                     stage=f"iteration_{iteration}",
+                    source="workflow_orchestrator",
                     message=f"Starting iteration {iteration}",
                 )
             )
@@ -448,7 +549,7 @@ class WorkflowOrchestrator:
                 start_time=iteration_start,
                 end_time=datetime.utcnow(),
                 success=success,
-                execution_time=(datetime.utcnow() - iteration_start).total_seconds(),
+                execution_time=self.clock() - iteration_clock_start,
                 stages=stage_results,
                 resource_usage=resource_usage,
                 should_continue=success,  # Continue if successful
@@ -461,7 +562,7 @@ class WorkflowOrchestrator:
                 start_time=iteration_start,
                 end_time=datetime.utcnow(),
                 success=False,
-                execution_time=(datetime.utcnow() - iteration_start).total_seconds(),
+                execution_time=self.clock() - iteration_clock_start,
                 stages={},
                 error=str(e),
                 should_continue=False,
@@ -474,10 +575,8 @@ class WorkflowOrchestrator:
         """Execute workflow steps sequentially."""
         results = {}
 
-        # Sort steps by dependencies
-        sorted_steps = self._topological_sort_steps()
-
-        for step in sorted_steps:
+        for step_id in self._plan.order:
+            step = self._plan.steps[step_id]
             step_result = await self._execute_single_step(pipeline_instance, step)
             results[step.step_id] = step_result
 
@@ -495,46 +594,65 @@ class WorkflowOrchestrator:
         self,
         pipeline_instance: Any,
     ) -> dict[str, StepResult]:
-        """Execute workflow steps in parallel where possible."""
+        """Execute workflow steps in parallel where possible.
+
+        Each step is launched as soon as its own dependencies have finished rather
+        than waiting for every other step in the same "layer", so a long branch
+        does not hold back an unrelated short one. When more steps are ready than
+        ``max_concurrent_steps`` allows, those with the most transitive dependents
+        go first (then higher ``priority``), keeping downstream work unblocked. A
+        failed critical step stops new steps from being scheduled; steps already
+        running are allowed to finish.
+        """
         results = {}
-        executed_steps = set()
-
-        while len(executed_steps) < len(self.workflow_steps):
-            # Find steps ready for execution
-            ready_steps = []
-            for step in self.workflow_steps:
-                if step.step_id not in executed_steps and all(
-                    dep in executed_steps for dep in step.dependencies
-                ):
-                    ready_steps.append(step)
-
-            if not ready_steps:
-                logger.error("No ready steps found - possible deadlock")
-                break
-
-            # Execute ready steps in parallel
-            tasks = [self._execute_single_step(pipeline_instance, step) for step in ready_steps]
-
-            step_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            for step, result in zip(ready_steps, step_results, strict=False):
-                if isinstance(result, Exception):
-                    logger.error(f"Step {step.step_id} execution failed: {result}")
+        plan = self._plan
+        sorter = TopologicalSorter(plan.deps)
+        sorter.prepare()
+
+        ready: list[tuple[int, int, int, str]] = []
+        pending: dict[asyncio.Task[StepResult], WorkflowStep] = {}
+        stop_scheduling = False
+
+        def schedule_ready() -> None:
+            for step_id in sorter.get_ready():
+                heapq.heappush(ready, (*plan.rank[step_id], step_id))
+            while ready and (
+                self.max_concurrent_steps is None or len(pending) < self.max_concurrent_steps
+            ):
+                step = plan.steps[heapq.heappop(ready)[-1]]
+                task = asyncio.create_task(self._execute_single_step(pipeline_instance, step))
+                pending[task] = step
+
+        schedule_ready()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                step = pending.pop(task)
+                error = task.exception()
+                if error is not None:
+                    logger.error(f"Step {step.step_id} execution failed: {error}")
                     step_result = StepResult(
                         step_id=step.step_id,
                         name=step.name,
                         success=False,
                         execution_time=0.0,
                         retry_count=0,
-                        error=str(result),
+                        error=str(error),
                     )
                 else:
-                    step_result = result
+                    step_result = task.result()
 
                 results[step.step_id] = step_result
                 self.step_results[step.step_id] = step_result
-                executed_steps.add(step.step_id)
+                sorter.done(step.step_id)
+
+                if not step_result.success and step.critical:
+                    logger.error(f"Critical step {step.step_id} failed, stopping execution")
+                    stop_scheduling = True
+
+            if not stop_scheduling:
+                schedule_ready()
 
         return results
 
@@ -543,12 +661,32 @@ class WorkflowOrchestrator:
         pipeline_instance: Any,
         step: WorkflowStep,
     ) -> StepResult:
-        """Execute a single workflow step with retry logic."""
+        """Execute a single workflow step with retry logic.
+
+        Steps marked ``cacheable`` are treated as pure functions of their component,
+        operation and parameters: a successful result is memoized and served again,
+        without calling the component, whenever the same call comes round on the
+        same pipeline within one workflow execution.
+        """
         step_start = datetime.utcnow()
 
+        cache_key = self._step_cache_key(pipeline_instance, step) if step.cacheable else None
+        if cache_key is not None and cache_key in self._step_cache:
+            logger.debug(f"Step {step.step_id} served from cache")
+            return StepResult(
+                step_id=step.step_id,
+                name=step.name,
+                success=True,
+                execution_time=0.0,
+                retry_count=0,
+                result=self._step_cache[cache_key],
+                start_time=step_start,
+                end_time=datetime.utcnow(),
+            )
+
         for attempt in range(step.retry_count + 1):
             try:
-                execution_start = time.time()
+                execution_start = self.clock()
 
                 # Update context
                 self.execution_context.current_stage = step.name
@@ -557,6 +695,7 @@ class WorkflowOrchestrator:
                 await publish_pipeline_stage_event(
                     stage=step.name,
                     status="started",
+                    source="workflow_orchestrator",
                     iteration=self.execution_context.current_iteration,
                 )
 
@@ -579,12 +718,15 @@ class WorkflowOrchestrator:
                         step.parameters,
                     )
 
-                execution_time = time.time() - execution_start
+                execution_time = self.clock() - execution_start
+                if cache_key is not None:
+                    self._step_cache[cache_key] = result
 
                 # Publish step completion event
                 await publish_pipeline_stage_event(
                     stage=step.name,
                     status="completed",
+                    source="workflow_orchestrator",
                     iteration=self.execution_context.current_iteration,
                     data={"execution_time": execution_time},
                 )
@@ -601,7 +743,7 @@ class WorkflowOrchestrator:
                 )
 
             except Exception as e:
-                execution_time = time.time() - execution_start
+                execution_time = self.clock() - execution_start
 
                 if attempt < step.retry_count:
                     logger.warning(
@@ -615,6 +757,7 @@ class WorkflowOrchestrator:
                     await publish_pipeline_stage_event(
                         stage=step.name,
                         status="failed",
+                        source="workflow_orchestrator",
                         iteration=self.execution_context.current_iteration,
                         error=str(e),
                     )
@@ -630,6 +773,23 @@ class WorkflowOrchestrator:
                         end_time=datetime.utcnow(),
                     )
 
+    def _step_cache_key(self, pipeline_instance: Any, step: WorkflowStep) -> bytes | None:
+        """Content hash of a step's call, or None if its parameters cannot be hashed."""
+        try:
+            payload = pickle.dumps(
+                (
+                    self.execution_context.workflow_id,
+                    id(pipeline_instance),
+                    step.name,
+                    step.component,
+                    step.operation,
+                    sorted(step.parameters.items()),
+                )
+            )
+        except Exception:
+            return None
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
     async def _call_component_method(
         self,
         pipeline_instance: Any,
@@ -650,39 +810,11 @@ class WorkflowOrchestrator:
         else:
             raise AttributeError(f"Operation {operation} not found on component {component}")
 
-        # Call method
-        if asyncio.iscoroutinefunction(method):
-            return await method(**parameters)
-        else:
-            return method(**parameters)
-
-    def _topological_sort_steps(self) -> list[WorkflowStep]:
-        """Sort workflow steps topologically based on dependencies."""
-        # Kahn's algorithm
-        in_degree = {step.step_id: 0 for step in self.workflow_steps}
-        graph = {step.step_id: [] for step in self.workflow_steps}
-        step_map = {step.step_id: step for step in self.workflow_steps}
-
-        # Build graph and calculate in-degrees
-        for step in self.workflow_steps:
-            for dep in step.dependencies:
-                graph[dep].append(step.step_id)
-                in_degree[step.step_id] += 1
-
-        # Find nodes with no incoming edges
-        queue = [step_id for step_id, degree in in_degree.items() if degree == 0]
-        result = []
-
-        while queue:
-            current = queue.pop(0)
-            result.append(step_map[current])
-
-            # Remove edges
-            for neighbor in graph[current]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-
+        # Call method; "__call__" on a bound coroutine method is not itself a coroutine
+        # function, so await whatever awaitable comes back rather than checking up front
+        result = method(**parameters)
+        if inspect.isawaitable(result):
+            result = await result
         return result
 
     def _should_create_checkpoint(self, iteration: int) -> bool:
@@ -751,6 +883,8 @@ class WorkflowOrchestrator:
         steps_data = checkpoint_data["workflow_steps"]
         self.workflow_steps = [WorkflowStep(**step_data) for step_data in steps_data]
 
+        self._plan = _compile_plan(self.workflow_steps)
+
         # Restore step results
         step_results_data = checkpoint_data["step_results"]
         self.step_results = {}
@@ -767,11 +901,12 @@ class WorkflowOrchestrator:
         """Complete the workflow execution."""
         self.state = OrchestrationState.COMPLETED
 
-        # Create final checkpoint
+        # Create final checkpoint and wait for queued checkpoint writes to land
         await self._create_checkpoint(CheckpointType.MILESTONE)
+        await self.checkpoint_manager.flush()
 
         # Stop resource monitoring
-        await self.resource_monitor.stop_monitoring()
+        await self._stop_resource_monitoring()
 
         logger.info("Workflow execution completed successfully")
 
@@ -779,11 +914,12 @@ class WorkflowOrchestrator:
         """Handle workflow failure."""
         self.state = OrchestrationState.FAILED
 
-        # Create error checkpoint
+        # Create error checkpoint and wait for queued checkpoint writes to land
         await self._create_checkpoint(CheckpointType.ERROR_RECOVERY)
+        await self.checkpoint_manager.flush()
 
         # Stop resource monitoring
-        await self.resource_monitor.stop_monitoring()
+        await self._stop_resource_monitoring()
 
         logger.error(f"Workflow execution failed: {error}")
 
@@ -821,7 +957,8 @@ class WorkflowOrchestrator:
         """Cancel the current workflow execution."""
         if self.state in [OrchestrationState.RUNNING, OrchestrationState.PAUSED]:
             self.state = OrchestrationState.CANCELLED
-            await self.resource_monitor.stop_monitoring()
+            await self._stop_resource_monitoring()
+            await self.checkpoint_manager.flush()
             logger.info("Workflow cancelled")
             return True
         return False
@@ -174,8 +174,8 @@ class ResourceMonitor:
         memory_available_gb = memory.available / (1024**3)
         memory_used_gb = memory.used / (1024**3)
 
-        # CPU information
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU information; sampling blocks for a second, so keep it off the event loop
+        cpu_percent = await asyncio.to_thread(psutil.cpu_percent, 1)
         cpu_count = psutil.cpu_count()
 
         # Disk information
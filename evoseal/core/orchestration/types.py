@@ -59,6 +59,7 @@ class WorkflowStep:
     critical: bool = True
     parallel_group: str | None = None
     priority: int = 0
+    cacheable: bool = False  # reuse the result of an earlier call with the same parameters
 
 
 @dataclass
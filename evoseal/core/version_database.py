@@ -8,10 +8,17 @@ from __future__ import annotations
 import json
 import logging
 from collections.abc import Mapping
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, time
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Type definitions
 VariantID = str
 VariantInfo = dict[str, Any]
@@ -23,6 +30,28 @@ VariantMetadata = dict[str, Any]  # Type alias for variant metadata
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode the types orjson handles natively the same way for the json fallback."""
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    return str(obj)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize *obj* to compact JSON bytes, using orjson when it is installed.
+
+    Both paths accept non-str keys and write datetimes as ISO 8601, so the
+    output does not depend on whether orjson is available.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
 class VersionDatabase:
     def __init__(self) -> None:
         # variant_id -> variant info
@@ -34,6 +63,8 @@ class VersionDatabase:
         # experiment tracking
         self.experiment_variants: dict[str, list[str]] = {}  # experiment_id -> variant_ids
         self.variant_experiments: dict[str, str] = {}  # variant_id -> experiment_id
+        # experiment_id -> number of variant writes touching that experiment
+        self.experiment_revisions: dict[str, int] = {}
 
     def add_variant(
         self,
@@ -57,12 +88,18 @@ class VersionDatabase:
             "experiment_id": experiment_id,
         }
 
+        # A re-added variant changes the experiment it used to belong to as well
+        previous = self.variant_experiments.get(variant_id)
+        if previous and previous != experiment_id:
+            self._bump_experiment_revision(previous)
+
         self.variants[variant_id] = variant_data
         self.lineage[variant_id] = parent_ids or []
         self.history.append(variant_id)
 
         # Track experiment association
         if experiment_id:
+            self._bump_experiment_revision(experiment_id)
             if experiment_id not in self.experiment_variants:
                 self.experiment_variants[experiment_id] = []
             self.experiment_variants[experiment_id].append(variant_id)
@@ -118,6 +155,22 @@ class VersionDatabase:
         """
         return self.experiment_variants.get(experiment_id, [])
 
+    def get_experiment_revision(self, experiment_id: str) -> int:
+        """Get a counter that changes whenever a variant of the experiment is written.
+
+        Args:
+            experiment_id: ID of the experiment
+
+        Returns:
+            Number of variant writes seen for the experiment (0 if none)
+        """
+        return self.experiment_revisions.get(experiment_id, 0)
+
+    def _bump_experiment_revision(self, experiment_id: str) -> None:
+        self.experiment_revisions[experiment_id] = (
+            self.experiment_revisions.get(experiment_id, 0) + 1
+        )
+
     def get_variant_experiment(self, variant_id: str) -> str | None:
         """Get the experiment ID associated with a variant.
 
@@ -170,12 +223,24 @@ class VersionDatabase:
             Dictionary with variant statistics
         """
         if experiment_id:
-            variant_ids = self.get_experiment_variants(experiment_id)
-            variants = [self.variants[vid] for vid in variant_ids if vid in self.variants]
+            # Read the scores from the variants themselves: a re-added variant_id
+            # is listed twice, and its latest data may belong to another experiment
+            variants = [
+                self.variants[vid]
+                for vid in dict.fromkeys(self.get_experiment_variants(experiment_id))
+                if self.variants[vid].get("experiment_id") == experiment_id
+            ]
+            scores = np.fromiter(
+                (v.get("eval_score", 0) for v in variants), dtype=float, count=len(variants)
+            )
         else:
-            variants = list(self.variants.values())
+            scores = np.fromiter(
+                (v.get("eval_score", 0) for v in self.variants.values()),
+                dtype=float,
+                count=len(self.variants),
+            )
 
-        if not variants:
+        if not scores.size:
             return {
                 "total_variants": 0,
                 "best_score": None,
@@ -184,51 +249,38 @@ class VersionDatabase:
                 "score_distribution": {},
             }
 
-        scores = [v.get("eval_score", 0) for v in variants]
-
         return {
-            "total_variants": len(variants),
-            "best_score": max(scores),
-            "worst_score": min(scores),
-            "average_score": sum(scores) / len(scores),
+            "total_variants": int(scores.size),
+            "best_score": float(scores.max()),
+            "worst_score": float(scores.min()),
+            "average_score": float(scores.mean()),
             "score_distribution": self._calculate_score_distribution(scores),
         }
 
-    def _calculate_score_distribution(self, scores: list[float]) -> dict[str, int]:
+    def _calculate_score_distribution(self, scores: np.ndarray) -> dict[str, int]:
         """Calculate score distribution in bins.
 
         Args:
-            scores: List of evaluation scores
+            scores: Array of evaluation scores
 
         Returns:
             Dictionary with score ranges and counts
         """
-        if not scores:
+        if not scores.size:
             return {}
 
-        min_score = min(scores)
-        max_score = max(scores)
+        min_score = float(scores.min())
+        max_score = float(scores.max())
 
         if min_score == max_score:
-            return {f"{min_score:.2f}": len(scores)}
+            return {f"{min_score:.2f}": int(scores.size)}
 
-        # Create 5 bins
+        # Create 5 bins; the last bin includes the max value
         bin_size = (max_score - min_score) / 5
-        distribution = {}
-
-        for i in range(5):
-            bin_start = min_score + i * bin_size
-            bin_end = min_score + (i + 1) * bin_size
-
-            if i == 4:  # Last bin includes max value
-                count = sum(1 for s in scores if bin_start <= s <= bin_end)
-            else:
-                count = sum(1 for s in scores if bin_start <= s < bin_end)
-
-            bin_label = f"{bin_start:.2f}-{bin_end:.2f}"
-            distribution[bin_label] = count
+        edges = min_score + np.arange(6) * bin_size
+        counts, _ = np.histogram(scores, bins=edges)
 
-        return distribution
+        return {f"{edges[i]:.2f}-{edges[i + 1]:.2f}": int(count) for i, count in enumerate(counts)}
 
     def export_variants(
         self, experiment_id: str | None = None, file_path: Path | None = None
@@ -259,15 +311,15 @@ class VersionDatabase:
             "experiment_id": experiment_id,
         }
 
-        json_data = json.dumps(export_data, indent=2, default=str)
+        json_data = _dumps(export_data)
 
         if file_path:
-            with open(file_path, "w") as f:
+            with open(file_path, "wb") as f:
                 f.write(json_data)
             logger.info(f"Exported variants to {file_path}")
             return None
         else:
-            return json_data
+            return json_data.decode()
 
     def import_variants(self, json_data: str | Path) -> int:
         """Import variants from JSON format.
@@ -294,6 +346,7 @@ class VersionDatabase:
                 # Import experiment association
                 experiment_id = variant_data.get("experiment_id")
                 if experiment_id:
+                    self._bump_experiment_revision(experiment_id)
                     if experiment_id not in self.experiment_variants:
                         self.experiment_variants[experiment_id] = []
                     self.experiment_variants[experiment_id].append(variant_id)
@@ -307,10 +307,11 @@ class VersionTracker:
                     shutil.copy2(artifact.file_path, dest_path)
 
         # Save checkpoint metadata
+        created_at = datetime.now(UTC)
         checkpoint_metadata = {
             "checkpoint_id": checkpoint_id,
             "experiment_id": experiment_id,
-            "created_at": datetime.now(UTC).isoformat(),
+            "created_at": created_at.isoformat(),
             "git_commit": experiment.git_commit,
             "git_branch": experiment.git_branch,
             "experiment_status": experiment.status.value,
@@ -321,9 +322,29 @@ class VersionTracker:
         with open(metadata_file, "w") as f:
             json.dump(checkpoint_metadata, f, indent=2)
 
+        # Index the checkpoint so listing doesn't need a directory scan
+        self.experiment_db.save_checkpoint(
+            checkpoint_id,
+            experiment_id,
+            checkpoint_dir,
+            name=checkpoint_name,
+            created_at=created_at,
+        )
+
         logger.info(f"Created checkpoint {checkpoint_id} for experiment {experiment_id}")
         return checkpoint_id
 
+    def list_checkpoints(self, experiment_id: str | None = None) -> list[dict[str, Any]]:
+        """List checkpoints from the checkpoint index, oldest first.
+
+        Args:
+            experiment_id: Optional experiment ID to filter by
+
+        Returns:
+            List of checkpoint records
+        """
+        return self.experiment_db.list_checkpoints(experiment_id)
+
     def restore_checkpoint(self, checkpoint_id: str) -> Experiment:
         """Restore an experiment from a checkpoint.
 
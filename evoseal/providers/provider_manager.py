@@ -302,6 +302,7 @@ class ProviderManager:
             Dictionary with provider information
         """
         provider_info = {}
+        probes = []
         for name, config in settings.seal.providers.items():
             info = {
                 "name": config.name,
@@ -314,19 +315,28 @@ class ProviderManager:
             if name in self._providers:
                 provider = self._providers[name]
                 if hasattr(provider, "health_check"):
-                    try:
-                        coro = provider.health_check()
-                        if health_check_timeout is not None:
-                            coro = asyncio.wait_for(coro, timeout=health_check_timeout)
-                        info["healthy"] = await coro
-                    except Exception as e:
-                        info["healthy"] = False
-                        info["health_error"] = str(e)
+                    probes.append(self._probe_health(provider, info, health_check_timeout))
                 else:
                     info["healthy"] = True
             provider_info[name] = info
+
+        # Run the health checks concurrently so the total wait is the slowest
+        # probe rather than the sum of all of them
+        await asyncio.gather(*probes)
         return provider_info
 
+    @staticmethod
+    async def _probe_health(provider: Any, info: dict[str, Any], timeout: float | None) -> None:
+        """Run *provider*'s health check and record the outcome in *info*."""
+        try:
+            coro = provider.health_check()
+            if timeout is not None:
+                coro = asyncio.wait_for(coro, timeout=timeout)
+            info["healthy"] = await coro
+        except Exception as e:
+            info["healthy"] = False
+            info["health_error"] = str(e)
+
     def list_providers(
         self, *, health_check_timeout: float | None = 30
     ) -> dict[str, dict[str, Any]]:
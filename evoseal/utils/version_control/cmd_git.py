@@ -607,6 +607,7 @@ class CmdGit(GitInterface):
         author: str | None = None,
         grep: str | None = None,
         oneline: bool = True,
+        pretty: str | None = None,
         **kwargs,
     ) -> GitResult:
         """
@@ -620,6 +621,7 @@ class CmdGit(GitInterface):
             author: Filter commits by author
             grep: Filter commits whose message matches the given pattern
             oneline: Show each commit on a single line (default: True)
+            pretty: Custom ``--pretty`` format (e.g. ``"format:%H %s"``); overrides oneline
             **kwargs: Additional log options as keyword arguments
 
         Returns:
@@ -646,7 +648,9 @@ class CmdGit(GitInterface):
                 cmd.extend(["--author", author])
             if grep:
                 cmd.extend(["--grep", grep])
-            if oneline:
+            if pretty:
+                cmd.append(f"--pretty={pretty}")
+            elif oneline:
                 cmd.append("--oneline")
 
             # Add additional options from kwargs
@@ -229,12 +229,13 @@ class GitInterface(ABC):
         pass
 
     @abstractmethod
-    def log(self, n: int = 10) -> GitResult:
+    def log(self, n: int = 10, pretty: str | None = None) -> GitResult:
         """
         Get the commit log.
 
         Args:
             n: Number of commits to show (default: 10)
+            pretty: Custom ``--pretty`` format (e.g. ``"format:%H %s"``)
 
         Returns:
             GitResult with log information
@@ -15,6 +15,12 @@ from .config import default_git_implementation
 
 logger = logging.getLogger(__name__)
 
+# One record per commit: hash, author, ISO date and subject separated by the
+# ASCII unit separator, each record terminated by the record separator
+_UNIT_SEP = "\x1f"
+_RECORD_SEP = "\x1e"
+_COMMIT_LOG_FORMAT = "format:%H%x1f%an <%ae>%x1f%aI%x1f%s%x1e"
+
 
 @dataclass
 class CommitInfo:
@@ -194,37 +200,25 @@ class VersionManager:
         Returns:
             List[CommitInfo]: List of commit information objects
         """
-        result = self.git.log(n=limit)
+        result = self.git.log(n=limit, pretty=_COMMIT_LOG_FORMAT)
         if not result.success:
             return []
 
         commits = []
-        current_commit = None
+        for record in result.output.split(_RECORD_SEP):
+            # Records are newline-separated; don't use bare strip(), which
+            # also treats the separators themselves as whitespace
+            record = record.strip("\n")
+            if not record:
+                continue
 
-        # Parse git log output
-        for line in result.output.splitlines():
-            if line.startswith("commit "):
-                if current_commit:
-                    commits.append(current_commit)
-                commit_hash = line[7:]
-                current_commit = CommitInfo(hash=commit_hash, author="", date=None, message="")
-            elif line.startswith("Author: "):
-                if current_commit:
-                    current_commit.author = line[8:].strip()
-            elif line.startswith("Date:   "):
-                if current_commit:
-                    # Parse date string (e.g., "Date:   Mon Jul 7 12:34:56 2025 +0800")
-                    date_str = line[8:].strip()
-                    try:
-                        current_commit.date = datetime.strptime(date_str, "%a %b %d %H:%M:%S %Y %z")
-                    except ValueError:
-                        logger.warning(f"Could not parse date: {date_str}")
-            elif line.strip() and not line.startswith("    "):
-                if current_commit:
-                    current_commit.message = line.strip()
-
-        if current_commit:
-            commits.append(current_commit)
+            commit_hash, author, date_str, message = record.split(_UNIT_SEP, 3)
+            try:
+                date = datetime.fromisoformat(date_str)
+            except ValueError:
+                logger.warning(f"Could not parse date: {date_str}")
+                date = None
+            commits.append(CommitInfo(hash=commit_hash, author=author, date=date, message=message))
 
         return commits
 
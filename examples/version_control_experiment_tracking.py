@@ -12,13 +12,14 @@ This example shows how to:
 
 import asyncio
 import json
-import secrets
 import tempfile
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 # EVOSEAL imports
-from evoseal.core.experiment_integration import ExperimentIntegration
+from evoseal.core.experiment_integration import ExperimentIntegration, PerfRow
 from evoseal.core.version_database import VersionDatabase
 from evoseal.core.version_tracker import VersionTracker
 from evoseal.models.experiment import (
@@ -26,13 +27,36 @@ from evoseal.models.experiment import (
 )
 
 
+def _init_git(repo_path: Path):
+    """Initialize a git repository with an initial commit (blocking)."""
+    from git import Repo
+
+    repo = Repo.init(repo_path)
+
+    # Create initial commit; the index takes paths relative to the work tree
+    (repo_path / "test.py").write_text(
+        "# Initial test file\ndef hello():\n    return 'Hello, EVOSEAL!'"
+    )
+    repo.index.add(["test.py"])
+    repo.index.commit("Initial commit")
+    return repo
+
+
 class MockEvolutionPipeline:
     """Mock evolution pipeline for demonstration purposes."""
 
-    def __init__(self, integration: ExperimentIntegration):
+    def __init__(
+        self,
+        integration: ExperimentIntegration,
+        seed: int | None = None,
+        simulate_compute_sec: float = 0.0,
+    ):
         self.integration = integration
         self.population_size = 20
         self.max_iterations = 10
+        self.rng = np.random.default_rng(seed)
+        # Simulated per-iteration compute time; 0 only yields to the event loop
+        self.simulate_compute_sec = simulate_compute_sec
 
     async def run_evolution(self, config: dict) -> dict:
         """Run a mock evolution process."""
@@ -53,14 +77,9 @@ class MockEvolutionPipeline:
         print(f"📊 Started experiment: {experiment.name} (ID: {experiment.id[:8]}...)")
 
         try:
-            # Initialize secure random number generator
-            secure_random = secrets.SystemRandom()
-
             # Simulate evolution iterations
             best_fitness = 0.0
-            population_fitness = [
-                secure_random.uniform(0.1, 0.5) for _ in range(self.population_size)
-            ]
+            population_fitness = self.rng.uniform(0.1, 0.5, self.population_size)
 
             for iteration in range(1, self.max_iterations + 1):
                 print(f"  🔄 Iteration {iteration}/{self.max_iterations}")
@@ -69,77 +88,82 @@ class MockEvolutionPipeline:
                 self.integration.track_iteration_start(iteration)
 
                 # Simulate evolution operations
-                await asyncio.sleep(0.1)  # Simulate computation time
-
-                # Generate new population with mutations
-                new_fitness = []
-                for i, fitness in enumerate(population_fitness):
-                    # Simulate mutation and selection using secure random
-                    mutation_strength = secure_random.uniform(-0.1, 0.2)
-                    new_fitness_val = max(0.0, fitness + mutation_strength)
-                    new_fitness.append(new_fitness_val)
-
-                    # Create variant for some individuals
-                    if random.random() < 0.3:  # 30% chance to create variant
-                        variant_id = f"variant_{iteration}_{i}"
-                        source_code = (
-                            f"def solution_{iteration}_{i}():\n    return {new_fitness_val:.3f}"
-                        )
-
-                        self.integration.track_variant_creation(
-                            variant_id=variant_id,
-                            source=source_code,
-                            test_results={"passed": random.choice([True, False])},
-                            eval_score=new_fitness_val,
-                            parent_ids=(
-                                [f"variant_{iteration - 1}_{i}"] if iteration > 1 else None
-                            ),
-                            generation=iteration,
-                            individual_index=i,
-                        )
-
-                population_fitness = new_fitness
-                current_best = max(population_fitness)
+                await asyncio.sleep(self.simulate_compute_sec)  # Simulate computation time
+
+                # Generate new population with mutations, drawing all of the
+                # iteration's random numbers in a few vectorized calls
+                mutations = self.rng.uniform(-0.1, 0.2, self.population_size)
+                create_variant = self.rng.random(self.population_size) < 0.3  # 30% chance
+                passed = self.rng.random(self.population_size) < 0.5
+                population_fitness = np.maximum(0.0, population_fitness + mutations)
+
+                # Create variant for some individuals
+                source_prefix = f"def solution_{iteration}_"
+                for i in np.flatnonzero(create_variant).tolist():
+                    new_fitness_val = float(population_fitness[i])
+                    variant_id = f"variant_{iteration}_{i}"
+                    source_code = f"{source_prefix}{i}():\n    return {new_fitness_val:.3f}"
+
+                    self.integration.track_variant_creation(
+                        variant_id=variant_id,
+                        source=source_code,
+                        test_results={"passed": bool(passed[i])},
+                        eval_score=new_fitness_val,
+                        parent_ids=([f"variant_{iteration - 1}_{i}"] if iteration > 1 else None),
+                        generation=iteration,
+                        individual_index=i,
+                    )
+
+                # Convergence: relative improvement of the best-so-far fitness. The
+                # first iteration has no earlier best to compare with, so skip it.
+                prev_best = best_fitness
+                current_best = float(population_fitness.max())
                 best_fitness = max(best_fitness, current_best)
+                convergence = {}
+                if iteration > 1:
+                    convergence["convergence_rate"] = (best_fitness - prev_best) / max(
+                        prev_best, 0.001
+                    )
+                perf = PerfRow(*self.rng.uniform([0.5, 50, 20], [2.0, 200, 80]).tolist())
 
                 # Track iteration completion
-                self.integration.track_iteration_complete(
+                self.integration.track_iteration(
                     iteration=iteration,
-                    fitness_scores=population_fitness,
+                    fitness_scores=population_fitness.tolist(),
                     best_fitness=current_best,
                     diversity=len(set(f"{f:.2f}" for f in population_fitness)),
-                    convergence_rate=abs(current_best - best_fitness) / max(best_fitness, 0.001),
-                )
-
-                # Track performance metrics
-                self.integration.track_performance_metrics(
-                    execution_time=random.uniform(0.5, 2.0),
-                    memory_usage=random.uniform(50, 200),
-                    cpu_usage=random.uniform(20, 80),
+                    **convergence,
+                    performance_metrics=perf._asdict(),
                 )
 
                 # Create checkpoint every 3 iterations
                 if iteration % 3 == 0:
-                    checkpoint_id = self.integration.create_checkpoint(f"iteration_{iteration}")
+                    checkpoint_id = await self.integration.aflush(
+                        self.integration.create_checkpoint, f"iteration_{iteration}"
+                    )
                     print(f"    💾 Created checkpoint: {checkpoint_id}")
 
                 print(
-                    f"    📈 Best fitness: {current_best:.4f}, Avg: {sum(population_fitness) / len(population_fitness):.4f}"
+                    f"    📈 Best fitness: {current_best:.4f}, Avg: {population_fitness.mean():.4f}"
                 )
 
             # Add final artifacts
-            self.integration.add_artifact(
-                name="final_population",
-                artifact_type="data",
-                content=json.dumps(population_fitness, indent=2),
-                iteration=self.max_iterations,
-            )
-
-            self.integration.add_artifact(
-                name="evolution_log",
-                artifact_type="log",
-                content=f"Evolution completed successfully with best fitness: {best_fitness:.4f}",
-                final_fitness=best_fitness,
+            await self.integration.aflush(
+                self.integration.add_artifacts,
+                [
+                    {
+                        "name": "final_population",
+                        "artifact_type": "data",
+                        "content": json.dumps(population_fitness.tolist(), indent=2),
+                        "iteration": self.max_iterations,
+                    },
+                    {
+                        "name": "evolution_log",
+                        "artifact_type": "log",
+                        "content": f"Evolution completed successfully with best fitness: {best_fitness:.4f}",
+                        "final_fitness": best_fitness,
+                    },
+                ],
             )
 
             # Create final result
@@ -161,7 +185,7 @@ class MockEvolutionPipeline:
             return {
                 "experiment_id": experiment.id,
                 "best_fitness": best_fitness,
-                "final_population": population_fitness,
+                "final_population": population_fitness.tolist(),
                 "status": "completed",
             }
 
@@ -192,67 +216,56 @@ async def demonstrate_version_control_tracking():
         repo_path = work_dir / "repositories" / "test_repo"
         repo_path.mkdir(parents=True, exist_ok=True)
 
-        # Initialize git repo (mock)
+        # Initialize git repo (mock) without blocking the event loop
         try:
-            from git import Repo
-
-            repo = Repo.init(repo_path)
-
-            # Create initial commit
-            test_file = repo_path / "test.py"
-            test_file.write_text("# Initial test file\ndef hello():\n    return 'Hello, EVOSEAL!'")
-            repo.index.add([str(test_file)])
-            repo.index.commit("Initial commit")
-
+            await asyncio.to_thread(_init_git, repo_path)
             print("📦 Created mock git repository")
         except ImportError:
             print("⚠️  GitPython not available, skipping git integration")
 
-        # Create mock evolution pipeline
-        pipeline = MockEvolutionPipeline(integration)
-
-        # Run multiple experiments
-        experiments = []
+        # Different configurations for each experiment
+        configs = [
+            {
+                "experiment_type": "evolution",
+                "population_size": 20,
+                "max_iterations": 10,
+                "mutation_rate": 0.1,
+                "crossover_rate": 0.8,
+                "selection_pressure": 2.0,
+            },
+            {
+                "experiment_type": "optimization",
+                "population_size": 30,
+                "max_iterations": 8,
+                "mutation_rate": 0.15,
+                "crossover_rate": 0.7,
+                "selection_pressure": 2.5,
+            },
+            {
+                "experiment_type": "comparison",
+                "population_size": 25,
+                "max_iterations": 12,
+                "mutation_rate": 0.05,
+                "crossover_rate": 0.9,
+                "selection_pressure": 1.8,
+            },
+        ]
 
         print("\n🔬 Running Experiments")
         print("-" * 30)
 
-        for i in range(3):
-            print(f"\n🧪 Experiment {i + 1}/3")
-
-            # Different configurations for each experiment
-            configs = [
-                {
-                    "experiment_type": "evolution",
-                    "population_size": 20,
-                    "max_iterations": 10,
-                    "mutation_rate": 0.1,
-                    "crossover_rate": 0.8,
-                    "selection_pressure": 2.0,
-                },
-                {
-                    "experiment_type": "optimization",
-                    "population_size": 30,
-                    "max_iterations": 8,
-                    "mutation_rate": 0.15,
-                    "crossover_rate": 0.7,
-                    "selection_pressure": 2.5,
-                },
-                {
-                    "experiment_type": "comparison",
-                    "population_size": 25,
-                    "max_iterations": 12,
-                    "mutation_rate": 0.05,
-                    "crossover_rate": 0.9,
-                    "selection_pressure": 1.8,
-                },
-            ]
-
-            result = await pipeline.run_evolution(configs[i])
-            experiments.append(result["experiment_id"])
-
-            # Small delay between experiments
-            await asyncio.sleep(0.2)
+        # Each concurrent run gets its own integration, since an
+        # ExperimentIntegration tracks a single current experiment.
+        pipelines = [
+            MockEvolutionPipeline(ExperimentIntegration(version_tracker), simulate_compute_sec=0.1)
+            for _ in configs
+        ]
+        results = await asyncio.gather(
+            *(pipeline.run_evolution(config) for pipeline, config in zip(pipelines, configs))
+        )
+        experiments = [result["experiment_id"] for result in results]
+        for pipeline in pipelines:
+            pipeline.integration.close()
 
         print("\n📊 Analyzing Results")
         print("-" * 30)
@@ -306,21 +319,19 @@ async def demonstrate_version_control_tracking():
         print("-" * 30)
 
         # List checkpoints
-        checkpoints_dir = work_dir / "checkpoints"
-        if checkpoints_dir.exists():
-            checkpoints = list(checkpoints_dir.iterdir())
-            print(f"Available checkpoints: {len(checkpoints)}")
-
-            if checkpoints:
-                # Restore from first checkpoint
-                checkpoint_id = checkpoints[0].name
-                print(f"Restoring from checkpoint: {checkpoint_id}")
-
-                try:
-                    restored_exp = version_tracker.restore_checkpoint(checkpoint_id)
-                    print(f"✅ Restored experiment: {restored_exp.name}")
-                except Exception as e:
-                    print(f"❌ Failed to restore checkpoint: {e}")
+        checkpoints = version_tracker.list_checkpoints()
+        print(f"Available checkpoints: {len(checkpoints)}")
+
+        if checkpoints:
+            # Restore from first checkpoint
+            checkpoint_id = checkpoints[0]["id"]
+            print(f"Restoring from checkpoint: {checkpoint_id}")
+
+            try:
+                restored_exp = version_tracker.restore_checkpoint(checkpoint_id)
+                print(f"✅ Restored experiment: {restored_exp.name}")
+            except Exception as e:
+                print(f"❌ Failed to restore checkpoint: {e}")
 
         # Export/Import demonstration
         print("\n📤 Data Export/Import")
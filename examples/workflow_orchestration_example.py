@@ -7,11 +7,13 @@ recovery, resource monitoring, and execution flow optimization.
 
 import asyncio
 import logging
+import os
 import time
 
 from evoseal.core.orchestration import (
     ExecutionStrategy,
     RecoveryStrategy,
+    ResourceMonitor,
     ResourceThresholds,
     WorkflowOrchestrator,
 )
@@ -22,6 +24,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# With FAST_MOCK set, simulated work runs TIME_SCALE times faster and the orchestrators
+# read a clock sped up by the same factor, so reported timings still look like real
+# runs while the demo finishes in a fraction of the time (handy for profiling).
+TIME_SCALE = 100.0 if os.environ.get("FAST_MOCK") else 1.0
+
+
+def sim_sleep(seconds):
+    """Simulate ``seconds`` of work, scaled down in FAST_MOCK mode."""
+    return asyncio.sleep(seconds / TIME_SCALE)
+
+
+def demo_clock():
+    """Orchestrator clock matching sim_sleep's time scale."""
+    return time.perf_counter() * TIME_SCALE
+
+
+# Lower thresholds than the defaults, so the demos are likely to raise alerts
+DEMO_RESOURCE_THRESHOLDS = ResourceThresholds(
+    memory_warning=0.6,
+    memory_critical=0.8,
+    cpu_warning=0.7,
+    cpu_critical=0.9,
+)
+
 
 class MockPipeline:
     """Mock pipeline for demonstration purposes."""
@@ -32,27 +58,27 @@ class MockPipeline:
 
     async def analyze_current_version(self, **kwargs):
         """Mock analysis step."""
-        await asyncio.sleep(1)  # Simulate work
+        await sim_sleep(1)  # Simulate work
         return {"analysis": "code quality: good", "suggestions": 3}
 
     async def generate_improvements(self, **kwargs):
         """Mock improvement generation step."""
-        await asyncio.sleep(2)  # Simulate work
+        await sim_sleep(2)  # Simulate work
 
         # Simulate occasional failure
-        if self.iteration_count % 7 == 0:  # Fail every 7th iteration
+        if (self.iteration_count + 1) % 7 == 0:  # Fail every 7th iteration
             raise RuntimeError("Generation service temporarily unavailable")
 
         return {"improvements": ["optimize loops", "reduce memory usage"], "count": 2}
 
     async def adapt_improvements(self, **kwargs):
         """Mock adaptation step."""
-        await asyncio.sleep(1.5)  # Simulate work
+        await sim_sleep(1.5)  # Simulate work
         return {"adapted": True, "changes": 5}
 
     async def evaluate_version(self, **kwargs):
         """Mock evaluation step."""
-        await asyncio.sleep(2.5)  # Simulate work
+        await sim_sleep(2.5)  # Simulate work
 
         # Simulate memory-intensive operation
         if self.iteration_count % 5 == 0:
@@ -62,18 +88,20 @@ class MockPipeline:
 
     async def validate_improvement(self, **kwargs):
         """Mock validation step."""
-        await asyncio.sleep(1)  # Simulate work
+        await sim_sleep(1)  # Simulate work
         self.iteration_count += 1
         return {"valid": True, "confidence": 0.9}
 
 
-async def demonstrate_basic_orchestration():
+async def demonstrate_basic_orchestration(resource_monitor=None):
     """Demonstrate basic workflow orchestration."""
     print("\n=== Basic Workflow Orchestration Demo ===")
 
     # Create orchestrator
     orchestrator = WorkflowOrchestrator(
         workspace_dir=".evoseal_demo",
+        resource_monitor=resource_monitor,
+        clock=demo_clock,
         checkpoint_interval=3,  # Checkpoint every 3 iterations
         execution_strategy=ExecutionStrategy.SEQUENTIAL,
     )
@@ -158,7 +186,7 @@ async def demonstrate_basic_orchestration():
     print(f"\nFinal workflow status: {status['state']}")
 
 
-async def demonstrate_recovery_orchestration():
+async def demonstrate_recovery_orchestration(resource_monitor=None):
     """Demonstrate workflow orchestration with recovery."""
     print("\n=== Recovery-Enabled Workflow Orchestration Demo ===")
 
@@ -174,6 +202,8 @@ async def demonstrate_recovery_orchestration():
     # Create orchestrator with recovery
     orchestrator = WorkflowOrchestrator(
         workspace_dir=".evoseal_demo_recovery",
+        resource_monitor=resource_monitor,
+        clock=demo_clock,
         checkpoint_interval=2,  # More frequent checkpoints
         execution_strategy=ExecutionStrategy.ADAPTIVE,
         recovery_strategy=recovery_strategy,
@@ -193,6 +223,7 @@ async def demonstrate_recovery_orchestration():
                 "critical": True,
                 "retry_count": 2,
                 "timeout": 10.0,
+                "cacheable": True,  # same input every iteration, so reuse the analysis
             },
             {
                 "name": "generate",
@@ -242,13 +273,15 @@ async def demonstrate_recovery_orchestration():
             print(f"Workflow execution failed even with recovery: {e}")
 
 
-async def demonstrate_parallel_orchestration():
+async def demonstrate_parallel_orchestration(resource_monitor=None):
     """Demonstrate parallel workflow orchestration."""
     print("\n=== Parallel Workflow Orchestration Demo ===")
 
     # Create orchestrator with parallel execution
     orchestrator = WorkflowOrchestrator(
         workspace_dir=".evoseal_demo_parallel",
+        resource_monitor=resource_monitor,
+        clock=demo_clock,
         checkpoint_interval=3,
         execution_strategy=ExecutionStrategy.PARALLEL,
     )
@@ -302,34 +335,34 @@ async def demonstrate_parallel_orchestration():
     if success:
         print(f"Parallel workflow initialized: {workflow_config['workflow_id']}")
 
-        start_time = time.time()
+        start = demo_clock()
         result = await orchestrator.execute_workflow(pipeline)
-        total_time = time.time() - start_time
+        total_time = demo_clock() - start
 
+        # generate (2s) and evaluate_current (2.5s) only depend on analyze, so they
+        # overlap: each iteration should take ~1 + max(2, 2.5) + 1 = 4.5s, not 6.5s
+        iteration_times = [it.execution_time for it in result.iterations]
         print("\nParallel workflow completed!")
         print(f"- Total wall-clock time: {total_time:.2f}s")
         print(f"- Pipeline execution time: {result.total_execution_time:.2f}s")
         print(f"- Iterations completed: {len(result.iterations)}")
+        if iteration_times:
+            average = sum(iteration_times) / len(iteration_times)
+            print(f"- Average iteration time: {average:.2f}s (critical path 4.5s, serial 6.5s)")
 
 
-async def demonstrate_resource_monitoring():
+async def demonstrate_resource_monitoring(resource_monitor=None):
     """Demonstrate resource monitoring integration."""
     print("\n=== Resource Monitoring Demo ===")
 
-    # Create resource thresholds
-    resource_thresholds = ResourceThresholds(
-        memory_warning=0.6,  # Lower thresholds for demo
-        memory_critical=0.8,
-        cpu_warning=0.7,
-        cpu_critical=0.9,
-    )
-
     # Create orchestrator with resource monitoring
     orchestrator = WorkflowOrchestrator(
         workspace_dir=".evoseal_demo_resources",
+        resource_monitor=resource_monitor,
+        clock=demo_clock,
         checkpoint_interval=2,
         execution_strategy=ExecutionStrategy.ADAPTIVE,
-        resource_thresholds=resource_thresholds,
+        resource_thresholds=DEMO_RESOURCE_THRESHOLDS,
         monitoring_interval=5.0,  # Check every 5 seconds
     )
 
@@ -367,8 +400,11 @@ async def demonstrate_resource_monitoring():
         print(f"- Monitoring active: {resource_stats['monitoring_active']}")
         print(f"- Snapshots collected: {resource_stats['snapshots_collected']}")
         print(f"- Active alerts: {resource_stats['active_alerts']}")
-        print(f"- Memory usage - Current: {resource_stats['memory_stats']['current']:.1f}%")
-        print(f"- CPU usage - Current: {resource_stats['cpu_stats']['current']:.1f}%")
+        # Usage figures are only reported once a snapshot exists; in FAST_MOCK mode the
+        # demo can finish before the first (one-second CPU sample) snapshot lands
+        if "memory_stats" in resource_stats:
+            print(f"- Memory usage - Current: {resource_stats['memory_stats']['current']:.1f}%")
+            print(f"- CPU usage - Current: {resource_stats['cpu_stats']['current']:.1f}%")
 
         # Show any alerts
         active_alerts = orchestrator.resource_monitor.get_active_alerts()
@@ -378,13 +414,15 @@ async def demonstrate_resource_monitoring():
                 print(f"- {alert.severity.upper()}: {alert.message}")
 
 
-async def demonstrate_checkpoint_management():
+async def demonstrate_checkpoint_management(resource_monitor=None):
     """Demonstrate checkpoint management."""
     print("\n=== Checkpoint Management Demo ===")
 
     # Create orchestrator
     orchestrator = WorkflowOrchestrator(
         workspace_dir=".evoseal_demo_checkpoints",
+        resource_monitor=resource_monitor,
+        clock=demo_clock,
         checkpoint_interval=2,  # Frequent checkpoints
         execution_strategy=ExecutionStrategy.SEQUENTIAL,
     )
@@ -442,28 +480,28 @@ async def main():
     print("EVOSEAL Workflow Orchestration System Demo")
     print("=" * 50)
 
+    demos = [
+        demonstrate_basic_orchestration,
+        demonstrate_recovery_orchestration,
+        demonstrate_parallel_orchestration,
+        demonstrate_resource_monitoring,
+        demonstrate_checkpoint_management,
+    ]
+    # One monitor samples the system for every demo instead of one per orchestrator
+    resource_monitor = ResourceMonitor(DEMO_RESOURCE_THRESHOLDS, monitoring_interval=5.0)
+    await resource_monitor.start_monitoring()
     try:
-        # Run all demonstrations
-        await demonstrate_basic_orchestration()
-        await asyncio.sleep(1)  # Brief pause between demos
-
-        await demonstrate_recovery_orchestration()
-        await asyncio.sleep(1)
-
-        await demonstrate_parallel_orchestration()
-        await asyncio.sleep(1)
-
-        await demonstrate_resource_monitoring()
-        await asyncio.sleep(1)
-
-        await demonstrate_checkpoint_management()
-
-        print("\n" + "=" * 50)
-        print("All workflow orchestration demonstrations completed!")
-
-    except Exception as e:
-        logger.error(f"Demo failed: {e}", exc_info=True)
-        print(f"Demo failed: {e}")
+        for demo in demos:
+            try:
+                await demo(resource_monitor=resource_monitor)
+            except Exception as e:
+                logger.error(f"Demo {demo.__name__} failed: {e}", exc_info=True)
+                print(f"Demo failed: {e}")
+    finally:
+        await resource_monitor.stop_monitoring()
+
+    print("\n" + "=" * 50)
+    print("All workflow orchestration demonstrations completed!")
 
 
 if __name__ == "__main__":
@@ -1,31 +1,18 @@
 #!/usr/bin/env python3
-"""
-DEPRECATED: This script has been replaced by scripts/lib/version/version.py
-Please update your workflows to use the new version management system:
-  ./scripts/evoseal version --help
-
-This script is kept only to point callers at the replacement and will be removed
-in a future release.
+"""DEPRECATED: replaced by scripts/lib/version/version.py (``./scripts/evoseal version``).
 
-Note: the previous "original script functionality" block below the deprecation
-notice was unreachable and syntactically invalid (an `except` with no `try`, and
-calls to functions that were never defined -- update_pyproject_version,
-git_commit_and_tag, push_changes). It could not run, so it has been removed
-rather than left as a parse error. Use `./scripts/evoseal version` instead.
+Pass ``--force`` to hand the remaining arguments straight to version.py,
+e.g. ``bump_version.py --force bump patch``; otherwise this exits non-zero.
 """
 
+import os
 import sys
+from pathlib import Path
 
-
-def main() -> None:
-    """Print the deprecation notice and exit non-zero."""
-    print("\n" + "=" * 80)
-    print("DEPRECATION WARNING: This script has been replaced by scripts/lib/version/version.py")
-    print("Please update your workflows to use the new version management system:")
-    print("  ./scripts/evoseal version --help")
-    print("=" * 80 + "\n")
-    sys.exit(1)
-
+# Resolved once (following symlinks) so the shim works from any cwd or link location
+VERSION_SCRIPT = Path(__file__).resolve().parent / "lib" / "version" / "version.py"
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] == ["--force"]:
+        os.execv(sys.executable, [sys.executable, VERSION_SCRIPT, *sys.argv[2:]])
+    sys.exit("DEPRECATED: use ./scripts/evoseal version --help (scripts/lib/version/version.py)")
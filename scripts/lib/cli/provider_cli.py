@@ -12,40 +12,53 @@ from pathlib import Path
 # Add EVOSEAL to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from evoseal.providers import provider_manager
+# provider_manager is imported inside each handler: loading it initializes the
+# providers, which --help and argparse errors should not pay for.
 
 
 async def list_providers():
     """List all available providers."""
-    print("📋 EVOSEAL Provider Status:")
-    print("=" * 50)
+    from evoseal.providers import provider_manager
+
+    # The header goes out before the (possibly slow) health probes; the report
+    # itself is collected and written in one go.
+    sys.stdout.write("📋 EVOSEAL Provider Status:\n" + "=" * 50 + "\n")
+    sys.stdout.flush()
 
     provider_info = await provider_manager.alist_providers()
 
+    lines = []
     for name, info in provider_info.items():
         status_icon = "✅" if info["enabled"] and info["available"] else "❌"
-        print(f"\n{status_icon} {name.upper()}")
-        print(f"   Enabled: {info['enabled']}")
-        print(f"   Available: {info['available']}")
-        print(f"   Priority: {info['priority']}")
-        print(f"   Initialized: {info['initialized']}")
+        lines.append(f"\n{status_icon} {name.upper()}")
+        lines.append(f"   Enabled: {info['enabled']}")
+        lines.append(f"   Available: {info['available']}")
+        lines.append(f"   Priority: {info['priority']}")
+        lines.append(f"   Initialized: {info['initialized']}")
 
         if "healthy" in info:
             health_icon = "💚" if info["healthy"] else "💔"
-            print(f"   Health: {health_icon} {'Healthy' if info['healthy'] else 'Unhealthy'}")
+            lines.append(
+                f"   Health: {health_icon} {'Healthy' if info['healthy'] else 'Unhealthy'}"
+            )
 
         if "health_error" in info:
-            print(f"   Error: {info['health_error']}")
+            lines.append(f"   Error: {info['health_error']}")
 
         if "health_note" in info:
-            print(f"   Note: {info['health_note']}")
+            lines.append(f"   Note: {info['health_note']}")
 
         if info["config"]:
-            print(f"   Config: {json.dumps(info['config'], indent=6)}")
+            lines.append(f"   Config: {json.dumps(info['config'], indent=6)}")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def test_provider(provider_name=None):
     """Test a specific provider or the best available one."""
+    from evoseal.providers import provider_manager
+
     try:
         if provider_name:
             print(f"🧪 Testing provider: {provider_name}")
@@ -84,6 +97,8 @@ async def test_provider(provider_name=None):
 async def health_check(provider_name=None):
     """Check health of a specific provider or all providers."""
     if provider_name:
+        from evoseal.providers import provider_manager
+
         try:
             provider = provider_manager.get_provider(provider_name)
             if hasattr(provider, "health_check"):
@@ -5,48 +5,109 @@ Generates comprehensive release notes from git history, changelog, and commits.
 """
 
 import argparse
+import functools
+import itertools
+import os
 import re
 import subprocess
 import sys
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 
-
-def run_command(cmd, capture_output=True):
-    """Run a shell command and return the output."""
+# Release-notes section header for each commit category, in output order
+SECTIONS = [
+    ("features", "## ✨ New Features\n\n"),
+    ("fixes", "## 🐛 Bug Fixes\n\n"),
+    ("security", "## 🔒 Security Improvements\n\n"),
+    ("performance", "## ⚡ Performance Improvements\n\n"),
+    ("ci", "## 👷 CI/CD & Infrastructure\n\n"),
+    ("docs", "## 📝 Documentation\n\n"),
+    ("refactor", "## ♻️ Code Improvements\n\n"),
+    ("other", "## 🔧 Other Changes\n\n"),
+]
+COMMIT_LINE = "- {message} ([{hash}](https://github.com/SHA888/EVOSEAL/commit/{hash}))\n"
+CHANGELOG_HEADER = re.compile(r"## \[([^\]]*)\]")
+GIT_LOG_FORMAT = "%h%x1f%s%x1f%an%x1f%ad%x1f%cs%x1e"
+
+# Conventional-commit prefixes and emoji per category, checked in this order.
+# Each category's alternatives are compiled into a single regex at import time.
+_CATEGORY_PATTERN_LISTS = {
+    "features": [r"^feat", r"^add", r"^implement", r"✨", r"🚀"],
+    "fixes": [r"^fix", r"^bug", r"🐛", r"🔧"],
+    "security": [r"^security", r"^sec", r"🔒", r"🛡️"],
+    "performance": [r"^perf", r"^optimize", r"⚡", r"🚀"],
+    "docs": [r"^docs?", r"^documentation", r"📝", r"📚"],
+    "ci": [r"^ci", r"^build", r"^deploy", r"👷", r"🔨"],
+    "refactor": [r"^refactor", r"^clean", r"^improve", r"♻️", r"🎨"],
+}
+CATEGORY_PATTERNS = {
+    category: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for category, patterns in _CATEGORY_PATTERN_LISTS.items()
+}
+
+
+def run_command(argv, capture_output=True):
+    """Run a command (an argv list, no shell) and return its output."""
     try:
-        result = subprocess.run(
-            cmd, shell=True, capture_output=capture_output, text=True, check=False
-        )
+        result = subprocess.run(argv, capture_output=capture_output, text=True, check=False)
         return result.stdout.strip() if capture_output else None
     except Exception as e:
-        print(f"Error running command '{cmd}': {e}")
+        print(f"Error running command '{' '.join(argv)}': {e}")
         return ""
 
 
-def get_git_log_between_tags(from_tag, to_tag):
-    """Get git commits between two tags."""
-    if from_tag:
-        cmd = f"git log --pretty=format:'%h|%s|%an|%ad' --date=short {from_tag}..{to_tag}"
-    else:
-        cmd = f"git log --pretty=format:'%h|%s|%an|%ad' --date=short {to_tag}"
+def _iter_records(stream, chunk_size=65536):
+    """Yield \x1e-terminated records from a binary stream as they arrive."""
+    pending = b""
+    while chunk := stream.read1(chunk_size):
+        *records, pending = (pending + chunk).split(b"\x1e")
+        yield from records
+    if pending:
+        yield pending
 
-    output = run_command(cmd)
-    commits = []
 
-    for line in output.split("\n"):
-        if line.strip():
-            parts = line.split("|")
-            if len(parts) >= 4:
-                commits.append(
-                    {"hash": parts[0], "message": parts[1], "author": parts[2], "date": parts[3]}
+def iter_git_log_between_tags(from_tag, to_tag):
+    """Stream git commits between two tags, parsing each one as git emits it."""
+    # Fields are separated by \x1f and records by \x1e, so subjects may contain any text
+    revision = f"{from_tag}..{to_tag}" if from_tag else to_tag
+    cmd = ["git", "log", f"--pretty=format:{GIT_LOG_FORMAT}", "--date=short", revision]
+
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except Exception as e:
+        print(f"Error running command '{' '.join(cmd)}': {e}")
+        return
+
+    with process:
+        for record in _iter_records(process.stdout):
+            fields = record.strip(b"\n").split(b"\x1f", 4)
+            if len(fields) == 5:
+                commit_hash, message, author, date, committed = (
+                    field.decode("utf-8", "replace") for field in fields
                 )
+                yield {
+                    "hash": commit_hash,
+                    "message": message,
+                    "author": author,
+                    "date": date,
+                    "committed": committed,
+                }
+
+
+def get_git_log_between_tags(from_tag, to_tag):
+    """Get git commits between two tags."""
+    return list(iter_git_log_between_tags(from_tag, to_tag))
 
-    return commits
 
+def categorize_commit_stream(commits):
+    """Categorize commits and collect their authors in a single pass.
 
-def categorize_commits(commits):
-    """Categorize commits by type based on conventional commit patterns."""
+    ``commits`` may be any iterable, including the stream from
+    :func:`iter_git_log_between_tags`; it is never materialized as a list.
+
+    Returns:
+        Tuple of (commits by category, set of contributors, total commit count)
+    """
     categories = {
         "features": [],
         "fixes": [],
@@ -57,81 +118,99 @@ def categorize_commits(commits):
         "refactor": [],
         "other": [],
     }
-
-    patterns = {
-        "features": [r"^feat", r"^add", r"^implement", r"✨", r"🚀"],
-        "fixes": [r"^fix", r"^bug", r"🐛", r"🔧"],
-        "security": [r"^security", r"^sec", r"🔒", r"🛡️"],
-        "performance": [r"^perf", r"^optimize", r"⚡", r"🚀"],
-        "docs": [r"^docs?", r"^documentation", r"📝", r"📚"],
-        "ci": [r"^ci", r"^build", r"^deploy", r"👷", r"🔨"],
-        "refactor": [r"^refactor", r"^clean", r"^improve", r"♻️", r"🎨"],
-    }
+    contributors = set()
+    total = 0
 
     for commit in commits:
         message = commit["message"].lower()
-        categorized = False
-
-        for category, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                if re.search(pattern, message, re.IGNORECASE):
-                    categories[category].append(commit)
-                    categorized = True
-                    break
-            if categorized:
-                break
+        contributors.add(commit["author"])
+        total += 1
 
-        if not categorized:
+        for category, pattern in CATEGORY_PATTERNS.items():
+            if pattern.search(message):
+                categories[category].append(commit)
+                break
+        else:
             categories["other"].append(commit)
 
-    return categories
+    return categories, contributors, total
 
 
-def extract_changelog_section(version):
-    """Extract the changelog section for a specific version."""
-    changelog_path = Path("CHANGELOG.md")
-    if not changelog_path.exists():
-        return ""
+def categorize_commits(commits):
+    """Categorize commits by type based on conventional commit patterns."""
+    return categorize_commit_stream(commits)[0]
 
-    content = changelog_path.read_text()
 
-    # Look for version section
-    version_pattern = rf"## \[{re.escape(version)}\].*?(?=## \[|\Z)"
-    match = re.search(version_pattern, content, re.DOTALL)
+def write_atomic(path, text):
+    """Write ``text`` to ``path`` so that readers never see a partially written file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb", buffering=1 << 16) as f:
+        f.write(text.encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
-    if match:
-        section = match.group(0)
-        # Clean up the section
-        lines = section.split("\n")[1:]  # Skip the version header
-        return "\n".join(line for line in lines if line.strip())
 
-    return ""
+@functools.lru_cache(maxsize=1)
+def _load_changelog_sections(path, mtime_ns):
+    """Split a changelog into {version: cleaned section} in one pass.
 
+    Cached per (path, mtime), so the file is re-read only after it changes.
+    """
+    if mtime_ns is None:
+        return {}
 
-def generate_release_notes(version, previous_version=None):
-    """Generate comprehensive release notes for a version."""
+    content = path.read_text()
+    headers = list(CHANGELOG_HEADER.finditer(content))
+    sections = {}
+    for header, next_header in zip(headers, headers[1:] + [None], strict=True):
+        end = next_header.start() if next_header else len(content)
+        lines = content[header.start() : end].split("\n")[1:]  # Skip the version header
+        sections.setdefault(header.group(1), "\n".join(line for line in lines if line.strip()))
+    return sections
 
-    # Get commits between versions
-    commits = get_git_log_between_tags(previous_version, f"v{version}")
-    categorized = categorize_commits(commits)
 
-    # Get changelog content
-    changelog_content = extract_changelog_section(version)
+def extract_changelog_section(version):
+    """Extract the changelog section for a specific version."""
+    path = Path("CHANGELOG.md").resolve()
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    return _load_changelog_sections(path, mtime_ns).get(version, "")
+
 
-    # Get release date
-    tag_date = run_command(f"git log -1 --format=%ci v{version} 2>/dev/null")
-    if tag_date and tag_date.strip():
-        try:
-            # Parse the git date format (e.g., "2025-07-27 01:36:33 +0000")
-            date_part = tag_date.split(" ")[0]  # Get just the date part
-            release_date = date_part
-        except (ValueError, IndexError):
-            release_date = datetime.now().strftime("%Y-%m-%d")
+def generate_release_notes(version, previous_version=None, now=None):
+    """Generate comprehensive release notes for a version.
+
+    ``now`` is the generation time (UTC) stamped into the notes; it defaults to
+    the current time and lets callers share one timestamp across generated files.
+    """
+    now = now or datetime.now(UTC)
+
+    # Stream commits between versions straight into their categories. git log
+    # emits the tagged commit first, so its committer date is the release date.
+    if previous_version and previous_version.removeprefix("v") == version.removeprefix("v"):
+        # Nothing can lie between a tag and itself, so skip running git at all
+        commits = iter(())
+    else:
+        commits = iter_git_log_between_tags(previous_version, f"v{version}")
+    tagged_commit = next(commits, None)
+    if tagged_commit is not None:
+        commits = itertools.chain([tagged_commit], commits)
+        release_date = tagged_commit["committed"]
     else:
-        release_date = datetime.now().strftime("%Y-%m-%d")
+        # Empty range: ask git for the tag's own date, if the tag exists yet
+        tag_date = run_command(["git", "log", "-1", "--format=%cs", f"v{version}"])
+        release_date = tag_date or now.strftime("%Y-%m-%d")
+    categorized, contributors, total_commits = categorize_commit_stream(commits)
 
-    # Generate release notes content
-    content = f"""# EVOSEAL v{version} Release Notes
+    # Get changelog content
+    changelog_content = extract_changelog_section(version)
+
+    # Generate release notes content; fragments are joined once at the end
+    parts = []
+    parts.append(f"""# EVOSEAL v{version} Release Notes
 
 ## 🎉 Release Highlights
 
@@ -140,63 +219,21 @@ def generate_release_notes(version, previous_version=None):
 ## 📅 Release Information
 - **Version**: {version}
 - **Release Date**: {release_date}
-- **Total Commits**: {len(commits)}
+- **Total Commits**: {total_commits}
 
-"""
+""")
 
-    # Add categorized changes
-    if categorized["features"]:
-        content += "## ✨ New Features\n\n"
-        for commit in categorized["features"]:
-            content += f"- {commit['message']} ([{commit['hash']}](https://github.com/SHA888/EVOSEAL/commit/{commit['hash']}))\n"
-        content += "\n"
-
-    if categorized["fixes"]:
-        content += "## 🐛 Bug Fixes\n\n"
-        for commit in categorized["fixes"]:
-            content += f"- {commit['message']} ([{commit['hash']}](https://github.com/SHA888/EVOSEAL/commit/{commit['hash']}))\n"
-        content += "\n"
-
-    if categorized["security"]:
-        content += "## 🔒 Security Improvements\n\n"
-        for commit in categorized["security"]:
-            content += f"- {commit['message']} ([{commit['hash']}](https://github.com/SHA888/EVOSEAL/commit/{commit['hash']}))\n"
-        content += "\n"
-
-    if categorized["performance"]:
-        content += "## ⚡ Performance Improvements\n\n"
-        for commit in categorized["performance"]:
-            content += f"- {commit['message']} ([{commit['hash']}](https://github.com/SHA888/EVOSEAL/commit/{commit['hash']}))\n"
-        content += "\n"
-
-    if categorized["ci"]:
-        content += "## 👷 CI/CD & Infrastructure\n\n"
-        for commit in categorized["ci"]:
-            content += f"- {commit['message']} ([{commit['hash']}](https://github.com/SHA888/EVOSEAL/commit/{commit['hash']}))\n"
-        content += "\n"
-
-    if categorized["docs"]:
-        content += "## 📝 Documentation\n\n"
-        for commit in categorized["docs"]:
-            content += f"- {commit['message']} ([{commit['hash']}](https://github.com/SHA888/EVOSEAL/commit/{commit['hash']}))\n"
-        content += "\n"
-
-    if categorized["refactor"]:
-        content += "## ♻️ Code Improvements\n\n"
-        for commit in categorized["refactor"]:
-            content += f"- {commit['message']} ([{commit['hash']}](https://github.com/SHA888/EVOSEAL/commit/{commit['hash']}))\n"
-        content += "\n"
-
-    # Add other changes if any
-    other_commits = categorized["other"]
-    if other_commits:
-        content += "## 🔧 Other Changes\n\n"
-        for commit in other_commits:
-            content += f"- {commit['message']} ([{commit['hash']}](https://github.com/SHA888/EVOSEAL/commit/{commit['hash']}))\n"
-        content += "\n"
+    # Add categorized changes, in SECTIONS order
+    for category, header in SECTIONS:
+        category_commits = categorized[category]
+        if not category_commits:
+            continue
+        parts.append(header)
+        parts.extend(map(COMMIT_LINE.format_map, category_commits))
+        parts.append("\n")
 
     # Add footer
-    content += """## 🔗 Useful Links
+    parts.append("""## 🔗 Useful Links
 
 - [📚 Documentation](https://sha888.github.io/EVOSEAL/)
 - [🐙 GitHub Repository](https://github.com/SHA888/EVOSEAL)
@@ -207,14 +244,12 @@ def generate_release_notes(version, previous_version=None):
 
 Thanks to all contributors who made this release possible:
 
-"""
+""")
 
     # Add unique contributors
-    contributors = set(commit["author"] for commit in commits)
-    for contributor in sorted(contributors):
-        content += f"- {contributor}\n"
+    parts.extend(f"- {contributor}\n" for contributor in sorted(contributors))
 
-    content += f"""
+    parts.append(f"""
 ---
 
 **Installation:**
@@ -227,10 +262,10 @@ pip install evoseal=={version}
 pip install --upgrade evoseal
 ```
 
-*This release was automatically generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")}*
-"""
+*This release was automatically generated on {now.strftime("%Y-%m-%d %H:%M:%S UTC")}*
+""")
 
-    return content
+    return "".join(parts)
 
 
 def main():
@@ -256,11 +291,12 @@ def main():
     # Generate release notes
     print(f"Generating release notes for v{args.version}...")
 
-    release_notes = generate_release_notes(args.version, args.previous_version)
+    now = datetime.now(UTC)
+    release_notes = generate_release_notes(args.version, args.previous_version, now)
 
     # Write release notes
     release_notes_path = output_dir / "RELEASE_NOTES.md"
-    release_notes_path.write_text(release_notes)
+    write_atomic(release_notes_path, release_notes)
 
     print(f"✅ Release notes generated: {release_notes_path}")
 
@@ -299,20 +335,20 @@ def main():
 - [ ] Document rollback steps
 - [ ] Test rollback procedure
 
-*Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")}*
+*Generated on: {now.strftime("%Y-%m-%d %H:%M:%S UTC")}*
 """
 
     checklist_path = output_dir / "RELEASE_CHECKLIST.md"
-    checklist_path.write_text(checklist_content)
+    write_atomic(checklist_path, checklist_content)
 
     print(f"✅ Release checklist generated: {checklist_path}")
 
     # Commit if requested
     if args.commit:
         print("Committing generated files...")
-        run_command(f"git add {output_dir}", capture_output=False)
+        run_command(["git", "add", str(output_dir)], capture_output=False)
         run_command(
-            f"git commit -m 'docs: Generate release notes for v{args.version}'",
+            ["git", "commit", "-m", f"docs: Generate release notes for v{args.version}"],
             capture_output=False,
         )
         print("✅ Files committed to git")
@@ -5,13 +5,44 @@ Generate release notes and changelog excerpts based on evolution metrics and git
 
 import json
 import os
+import re
 import subprocess
-from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+CHANGE_SECTIONS = (
+    ("features", "\n## ✨ New Features"),
+    ("fixes", "\n## 🐛 Bug Fixes"),
+    ("performance_improvements", "\n## ⚡ Performance Improvements"),
+)
+# Commit subject prefixes; the matching group's index picks the category
+COMMIT_CATEGORY_RE = re.compile(r"(feat|add|new)|(fix|bug|issue)|(perf|optimize)", re.I)
+COMMIT_CATEGORIES = ("features", "fixes", "performance_improvements")
+RELEASE_FOOTER = """
+## 📋 Release Checklist
+- [ ] Update version in pyproject.toml
+- [ ] Run tests
+- [ ] Update documentation
+- [ ] Create GitHub release
+- [ ] Verify PyPI upload
+
+## 📝 Notes
+Add any additional notes here."""
+
+
+def iter_git_changes(since_tag: str) -> Iterator[dict]:
+    """Stream commits since the last release, parsing each line as git emits it."""
+    if since_tag == "HEAD":
+        # The fallback when no previous tag exists: HEAD..HEAD is empty, skip git
+        return
 
-def get_git_changes(since_tag: str) -> list[dict]:
-    """Get commit history since the last release."""
     cmd = [
         "git",
         "log",
@@ -20,156 +51,186 @@ def get_git_changes(since_tag: str) -> list[dict]:
         "--date=short",
         "--no-merges",
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True) as process:
+        for line in process.stdout:
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            commit_hash, author, commit_date, message = line.split("|", 3)
+            yield {"hash": commit_hash, "author": author, "date": commit_date, "message": message}
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+
+def get_git_changes(since_tag: str) -> list[dict]:
+    """Get commit history since the last release."""
+    return list(iter_git_changes(since_tag))
+
+
+def previous_tag(version: str) -> str | None:
+    """Return the nearest tag reachable from the commit before *version*, or None."""
+    try:
+        output = subprocess.check_output(
+            ["git", "describe", "--tags", "--abbrev=0", f"{version}^"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.strip() or None
+
+
+def categorize_changes(changes: list[dict]) -> dict[str, list[dict]]:
+    """Split commits into COMMIT_CATEGORIES by subject prefix in a single pass."""
+    categorized: dict[str, list[dict]] = {category: [] for category in COMMIT_CATEGORIES}
+    for change in changes:
+        match = COMMIT_CATEGORY_RE.match(change["message"])
+        if match:
+            categorized[COMMIT_CATEGORIES[match.lastindex - 1]].append(change)
+    return categorized
 
-    changes = []
-    for line in result.stdout.strip().split("\n"):
-        if not line:
-            continue
-        commit_hash, author, date, message = line.split("|", 3)
-        changes.append({"hash": commit_hash, "author": author, "date": date, "message": message})
-    return changes
+
+def _load_metrics_file(path: str) -> dict | None:
+    """Read and parse one metrics file, or return None if it is unreadable."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (ValueError, FileNotFoundError):
+        return None
 
 
 def load_evolution_metrics() -> dict:
     """Load evolution metrics from the metrics directory."""
     metrics_dir = Path("metrics")
-    metrics = {
-        "iterations": 0,
-        "improvements": 0,
-        "regressions": 0,
-        "features": [],
-        "fixes": [],
-    }
-
-    if not metrics_dir.exists():
-        return metrics
-
-    for metric_file in metrics_dir.glob("evolution_*.json"):
-        try:
-            with open(metric_file) as f:
-                data = json.load(f)
-                metrics["iterations"] += data.get("iterations", 0)
-                metrics["improvements"] += data.get("improvements", 0)
-                metrics["regressions"] += data.get("regressions", 0)
-                metrics["features"].extend(data.get("new_features", []))
-                metrics["fixes"].extend(data.get("bug_fixes", []))
-        except (json.JSONDecodeError, FileNotFoundError):
+    iterations = improvements = regressions = 0
+    # Sets, so features/fixes repeated across metric files are stored once
+    features: set[str] = set()
+    fixes: set[str] = set()
+
+    try:
+        with os.scandir(metrics_dir) as it:
+            paths = [
+                entry.path
+                for entry in it
+                if entry.name.startswith("evolution_")
+                and entry.name.endswith(".json")
+                and entry.stat().st_size
+            ]
+    except FileNotFoundError:
+        paths = []
+
+    # Reads overlap in worker threads; the totals are reduced here in one thread
+    with ThreadPoolExecutor(max_workers=min(8, len(paths) or 1)) as executor:
+        loaded = list(executor.map(_load_metrics_file, paths))
+
+    for data in loaded:
+        if data is None:
             continue
-
-    return metrics
+        iterations += data.get("iterations", 0)
+        improvements += data.get("improvements", 0)
+        regressions += data.get("regressions", 0)
+        features.update(data.get("new_features") or ())
+        fixes.update(data.get("bug_fixes") or ())
+
+    return {
+        "iterations": iterations,
+        "improvements": improvements,
+        "regressions": regressions,
+        # Sorted once here so renderers can use them directly and output is stable
+        "features": sorted(features),
+        "fixes": sorted(fixes),
+    }
 
 
-def generate_changelog_excerpt(version: str, metrics: dict, changes: list[dict]) -> str:
+def generate_changelog_excerpt(
+    version: str, metrics: dict, changes: list[dict], today: str | None = None
+) -> str:
     """Generate changelog excerpt with evolution highlights."""
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = today or date.today().isoformat()
 
     # Categorize changes
-    features = [c for c in changes if c["message"].lower().startswith(("feat", "add", "new"))]
-    fixes = [c for c in changes if c["message"].lower().startswith(("fix", "bug", "issue"))]
+    features = categorize_changes(changes)["features"]
 
+    # Header and evolution metrics
     output = [
-        f"# EVOSEAL {version} - Release Notes\n",
-        f"*Released on: {today}*\n",
-        "## 🚀 Evolution Highlights\n",
-    ]
+        f"""# EVOSEAL {version} - Release Notes
 
-    # Add evolution metrics
-    output.append(f"- **Evolution Cycles**: {metrics['iterations']} iterations completed")
-    output.append(f"- **Improvements**: {metrics['improvements']} significant improvements")
-    output.append(
-        f"- **Issues Resolved**: {metrics['regressions']} regressions detected and addressed\n"
-    )
+*Released on: {today}*
+
+## 🚀 Evolution Highlights
+
+- **Evolution Cycles**: {metrics["iterations"]} iterations completed
+- **Improvements**: {metrics["improvements"]} significant improvements
+- **Issues Resolved**: {metrics["regressions"]} regressions detected and addressed
+"""
+    ]
 
     # Add features from evolution
     if metrics["features"]:
         output.append("## ✨ New Features (AI-Generated)")
-        for feature in set(metrics["features"]):  # Remove duplicates
-            output.append(f"- {feature}")
+        output.extend(f"- {feature}" for feature in metrics["features"])
         output.append("")
 
     # Add fixes from evolution
     if metrics["fixes"]:
         output.append("## 🐛 Fixes (AI-Validated)")
-        for fix in set(metrics["fixes"]):  # Remove duplicates
-            output.append(f"- {fix}")
+        output.extend(f"- {fix}" for fix in metrics["fixes"])
         output.append("")
 
     # Add notable commits
     if features:
         output.append("## 📝 Notable Commits")
-        for commit in features[:5]:  # Limit to top 5 features
-            output.append(f"- {commit['message']} (*{commit['author']}*)")
+        # Limit to top 5 features
+        output.extend(f"- {commit['message']} (*{commit['author']}*)" for commit in features[:5])
+
+    return "\n".join(output)
 
 
-def generate_release_notes(version: str, metrics: dict, changes: list[dict]) -> str:
+def generate_release_notes(
+    version: str, metrics: dict, changes: list[dict], today: str | None = None
+) -> str:
     """Generate comprehensive release notes."""
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = today or date.today().isoformat()
     output = [
-        f"# EVOSEAL {version}\n",
-        f"*Released on: {today}*\n",
-        "## 🚀 Release Highlights\n",
+        f"""# EVOSEAL {version}
+
+*Released on: {today}*
+
+## 🚀 Release Highlights
+"""
     ]
 
     # Add metrics if available
     if metrics.get("metrics"):
         m = metrics["metrics"]
+        code_size = m.get("code_size") or {}
         output.append(
-            f"- **Code Changes**: {m.get('code_size', {}).get('added', 0)} lines added, "
-            f"{m.get('code_size', {}).get('deleted', 0)} lines removed"
-        )
-        output.append(
-            f"- **Files Changed**: {m.get('code_size', {}).get('files_changed', 0)} files"
+            f"- **Code Changes**: {code_size.get('added', 0)} lines added, "
+            f"{code_size.get('deleted', 0)} lines removed"
         )
+        output.append(f"- **Files Changed**: {code_size.get('files_changed', 0)} files")
         if "test_coverage" in m:
             output.append(f"- **Test Coverage**: {float(m['test_coverage']) * 100:.1f}%")
 
     # Add changes by category
-    if metrics.get("changes"):
-        changes = metrics["changes"]
-
-        # New Features
-        if changes.get("features"):
-            output.append("\n## ✨ New Features")
-            for feature in changes["features"]:
-                if feature.strip():
-                    output.append(f"- {feature.strip()}")
-
-        # Bug Fixes
-        if changes.get("fixes"):
-            output.append("\n## 🐛 Bug Fixes")
-            for fix in changes["fixes"]:
-                if fix.strip():
-                    output.append(f"- {fix.strip()}")
-
-        # Performance Improvements
-        if changes.get("performance_improvements"):
-            output.append("\n## ⚡ Performance Improvements")
-            for perf in changes["performance_improvements"]:
-                if perf.strip():
-                    output.append(f"- {perf.strip()}")
+    categorized = metrics.get("changes")
+    if categorized:
+        for key, header in CHANGE_SECTIONS:
+            if categorized.get(key):
+                output.append(header)
+                output.extend(f"- {entry.strip()}" for entry in categorized[key] if entry.strip())
 
     # Add notable commits if no other changes found
-    if changes and not metrics.get("changes"):
+    if changes and not categorized:
         output.append("\n## 📝 Notable Changes")
-        for change in changes[:5]:
-            output.append(f"- `{change['hash'][:7]}` {change['message']} (*{change['date']}*)")
+        output.extend(
+            f"- `{change['hash'][:7]}` {change['message']} (*{change['date']}*)"
+            for change in changes[:5]
+        )
 
     # Add footer
-    output.extend(
-        [
-            "",
-            "## 📋 Release Checklist",
-            "- [ ] Update version in pyproject.toml",
-            "- [ ] Run tests",
-            "- [ ] Update documentation",
-            "- [ ] Create GitHub release",
-            "- [ ] Verify PyPI upload",
-            "",
-            "## 📝 Notes",
-            "Add any additional notes here.",
-        ]
-    )
+    output.append(RELEASE_FOOTER)
 
     return "\n".join(output)
 
@@ -193,17 +254,7 @@ def main():
 
     # Auto-detect previous version if not specified
     if not args.since:
-        try:
-            args.since = (
-                subprocess.check_output(
-                    ["git", "describe", "--tags", "--abbrev=0", f"{args.version}^"],
-                    stderr=subprocess.DEVNULL,
-                )
-                .decode()
-                .strip()
-            )
-        except subprocess.CalledProcessError:
-            args.since = "HEAD"  # Fallback if no previous tag found
+        args.since = previous_tag(args.version) or "HEAD"  # Fallback if no previous tag found
 
     # Get changes and metrics
     changes = get_git_changes(args.since)
@@ -211,28 +262,17 @@ def main():
 
     # If no metrics found, extract from git changes
     if not metrics and changes:
+        categorized = categorize_changes(changes)
         metrics = {
             "changes": {
-                "features": [
-                    c["message"]
-                    for c in changes
-                    if c["message"].lower().startswith(("feat", "add", "new"))
-                ],
-                "fixes": [
-                    c["message"]
-                    for c in changes
-                    if c["message"].lower().startswith(("fix", "bug", "issue"))
-                ],
-                "performance_improvements": [
-                    c["message"]
-                    for c in changes
-                    if c["message"].lower().startswith(("perf", "optimize"))
-                ],
+                category: [c["message"] for c in categorized[category]]
+                for category in COMMIT_CATEGORIES
             }
         }
 
     # Generate and save release notes
-    release_notes = generate_release_notes(args.version, metrics, changes)
+    today = date.today().isoformat()
+    release_notes = generate_release_notes(args.version, metrics, changes, today=today)
     with open(os.path.join(version_dir, "RELEASE_NOTES.md"), "w") as f:
         f.write(release_notes)
 
@@ -4,6 +4,8 @@ Organize release notes into their respective version directories.
 Moves files from metrics/ to releases/<version>/RELEASE_NOTES.md
 """
 
+import errno
+import os
 import re
 import shutil
 from pathlib import Path
@@ -12,10 +14,22 @@ from pathlib import Path
 METRICS_DIR = Path("metrics")
 RELEASES_DIR = Path("releases")
 
+RELEASE_NOTES_RE = re.compile(r"release_notes_(\d+\.\d+\.\d+)\.md")
+
+
+def _move(src: Path, dst: Path) -> None:
+    """Move *src* to *dst* with a single rename, copying only across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
 
 def extract_version(filename):
     """Extract version number from filename."""
-    match = re.search(r"release_notes_(\d+\.\d+\.\d+)\.md", filename)
+    match = RELEASE_NOTES_RE.search(filename)
     return match.group(1) if match else None
 
 
@@ -24,11 +38,20 @@ def organize_release_notes():
     # Create releases directory if it doesn't exist
     RELEASES_DIR.mkdir(exist_ok=True)
 
-    # Find all release note files in metrics directory
-    for note_file in METRICS_DIR.glob("release_notes_*.md"):
-        version = extract_version(note_file.name)
+    # List the metrics directory once; changelog lookups then hit this set
+    try:
+        with os.scandir(METRICS_DIR) as it:
+            names = {entry.name for entry in it}
+    except FileNotFoundError:
+        return
+
+    for name in sorted(names):
+        if not name.startswith("release_notes_") or not name.endswith(".md"):
+            continue
+        note_file = METRICS_DIR / name
+        version = extract_version(name)
         if not version:
-            print(f"Skipping invalid filename format: {note_file.name}")
+            print(f"Skipping invalid filename format: {name}")
             continue
 
         # Create version directory if it doesn't exist
@@ -39,14 +62,15 @@ def organize_release_notes():
         target_path = version_dir / "RELEASE_NOTES.md"
 
         # Move the file
-        shutil.move(str(note_file), str(target_path))
+        _move(note_file, target_path)
         print(f"Moved: {note_file} -> {target_path}")
 
         # If there's a corresponding changelog, move it too
-        changelog_src = METRICS_DIR / f"changelog_{version}.md"
-        if changelog_src.exists():
+        changelog_name = f"changelog_{version}.md"
+        if changelog_name in names:
+            changelog_src = METRICS_DIR / changelog_name
             changelog_dest = version_dir / "CHANGELOG.md"
-            shutil.move(str(changelog_src), str(changelog_dest))
+            _move(changelog_src, changelog_dest)
             print(f"Moved: {changelog_src} -> {changelog_dest}")
 
 
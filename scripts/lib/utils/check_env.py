@@ -4,59 +4,97 @@ Environment validation script for EVOSEAL.
 Checks for required environment variables and dependencies.
 """
 
+import enum
+import io
 import logging
 import os
 import sys
+from pathlib import Path
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
 logger = logging.getLogger(__name__)
 
+# This file lives at <repo>/scripts/lib/utils/check_env.py, so the repo root is
+# three levels up. Default paths are resolved once here rather than per call.
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_ENVIRONMENT = {
+    "PYTHONPATH": f"{PROJECT_ROOT}:{PROJECT_ROOT / 'SEAL'}",
+    "EVOSEAL_HOME": str(PROJECT_ROOT),
+    "EVOSEAL_VENV": str(PROJECT_ROOT / ".venv"),
+    "EVOSEAL_LOGS": str(PROJECT_ROOT / "logs"),
+    "EVOSEAL_DATA": str(PROJECT_ROOT / "data"),
+}
+
+
+class Check(enum.IntFlag):
+    """Stages of :func:`check_environment`; ``EVOSEAL_CHECK_LEVEL`` selects a subset."""
+
+    ENV_VARS = 1
+    PYTHON = 2
+    ALL = ENV_VARS | PYTHON
+
 
 def setup_default_environment():
     """Set up default environment variables if they don't exist."""
-    # Set default values based on the current directory
-    default_home = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    defaults = {
-        "PYTHONPATH": f"{default_home}:{default_home}/SEAL",
-        "EVOSEAL_HOME": default_home,
-        "EVOSEAL_VENV": os.path.join(default_home, ".venv"),
-        "EVOSEAL_LOGS": os.path.join(default_home, "logs"),
-        "EVOSEAL_DATA": os.path.join(default_home, "data"),
-    }
-
-    # Set defaults if not already set
-    for key, value in defaults.items():
-        if key not in os.environ:
-            os.environ[key] = value
+    # Look each key up once and keep the effective values, rather than going
+    # back through os.environ (which re-encodes keys on every access)
+    environ = os.environ
+    effective = {}
+    for key, default in DEFAULT_ENVIRONMENT.items():
+        value = environ.get(key)
+        if value is None:
+            environ[key] = value = default
             logger.warning(f"⚠️  Using default {key}={value}")
+        effective[key] = value
 
     # Ensure directories exist
-    for dir_path in [os.environ["EVOSEAL_LOGS"], os.environ["EVOSEAL_DATA"]]:
+    for dir_path in (effective["EVOSEAL_LOGS"], effective["EVOSEAL_DATA"]):
         os.makedirs(dir_path, exist_ok=True)
         logger.info(f"📁 Ensured directory exists: {dir_path}")
 
 
-def check_environment():
-    """Check the environment for required configuration."""
-    logger.info("🔍 Validating environment configuration...")
+def check_environment(checks: Check = Check.ALL):
+    """Check the environment for required configuration.
 
-    # Set up default environment
-    setup_default_environment()
+    Args:
+        checks: Which stages to run; stages not selected are skipped entirely.
+    """
+    logger.info("🔍 Validating environment configuration...")
 
-    # Check Python version
-    if sys.version_info < (3, 8):
+    # Check Python version first: it is the cheapest check and fails fast
+    if Check.PYTHON in checks and sys.version_info < (3, 8):
         logger.error("❌ Python 3.8 or higher is required")
         return False
 
+    # Set up default environment
+    if Check.ENV_VARS in checks:
+        setup_default_environment()
+
     logger.info("✅ Environment validation passed")
     return True
 
 
+def main() -> int:
+    """Run the checks, emitting the whole report with a single stdout write."""
+    report = io.StringIO()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(report)],
+    )
+    try:
+        level = os.environ.get("EVOSEAL_CHECK_LEVEL")
+        checks = Check.ALL
+        if level:
+            try:
+                checks = Check(int(level)) & Check.ALL
+            except ValueError:
+                logger.warning(f"⚠️  Ignoring invalid EVOSEAL_CHECK_LEVEL={level!r}")
+        ok = check_environment(checks)
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+    return 0 if ok else 1
+
+
 if __name__ == "__main__":
-    if not check_environment():
-        sys.exit(1)
+    sys.exit(main())
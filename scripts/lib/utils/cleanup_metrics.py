@@ -8,6 +8,9 @@ This script:
 3. Maintains a clean directory structure
 """
 
+import errno
+import os
+import re
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -19,24 +22,31 @@ ARCHIVE_DIR = Path("archived_metrics")
 KEEP_LAST_N = 3  # Number of metrics files to keep per version
 KEEP_DAYS = 30  # Keep files newer than this many days
 
+# evolution_X.Y.Z_<timestamp>.json or evolution_vX.Y.Z.json
+_EVOLUTION_FILE_RE = re.compile(r"^evolution_v?(\d+(?:\.\d+)*)(?:_(.+))?\.json$")
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+
+def _move(src: Path, dst: Path) -> None:
+    """Move *src* to *dst* with a single rename, copying only across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
 
 def parse_version_timestamp(filename: str) -> tuple | None:
     """Parse version and timestamp from filename."""
-    if not filename.startswith("evolution_") or not filename.endswith(".json"):
+    match = _EVOLUTION_FILE_RE.match(filename)
+    if not match:
         return None
 
-    try:
-        # Handle both formats: evolution_X.Y.Z_*.json and evolution_vX.Y.Z.json
-        if filename.startswith("evolution_v"):
-            version = filename[10:-5]  # Remove 'evolution_' and '.json'
-            return (version, 0)  # No timestamp in this format
-        else:
-            parts = filename[9:-5].split("_")  # Remove 'evolution_' and '.json'
-            version = parts[0]
-            timestamp = int("".join(filter(str.isdigit, "_".join(parts[1:]))))
-            return (version, timestamp)
-    except (IndexError, ValueError):
-        return None
+    version, stamp = match.groups()
+    # Timestamps look like 2025_07_23T01_45_40Z; keep just the digits
+    digits = _NON_DIGITS_RE.sub("", stamp or "")
+    return (version, int(digits) if digits else 0)
 
 
 def cleanup_metrics():
@@ -47,11 +57,15 @@ def cleanup_metrics():
     # Group files by version
     version_files: dict[str, list[Path]] = {}
 
-    for file in METRICS_DIR.glob("evolution_*.json"):
-        parsed = parse_version_timestamp(file.name)
-        if parsed:
-            version, timestamp = parsed
-            version_files.setdefault(version, []).append((timestamp, file))
+    try:
+        with os.scandir(METRICS_DIR) as it:
+            for entry in it:
+                parsed = parse_version_timestamp(entry.name)
+                if parsed:
+                    version, timestamp = parsed
+                    version_files.setdefault(version, []).append((timestamp, Path(entry.path)))
+    except FileNotFoundError:
+        return
 
     # Keep only the last N files per version and archive the rest
     for version, files in version_files.items():
@@ -63,7 +77,7 @@ def cleanup_metrics():
             if i >= KEEP_LAST_N:
                 # Move to archive
                 archive_path = ARCHIVE_DIR / f"{file.stem}_{timestamp}.json"
-                shutil.move(str(file), str(archive_path))
+                _move(file, archive_path)
                 print(f"Archived: {file.name} -> {archive_path}")
 
 
@@ -78,7 +92,7 @@ def cleanup_release_notes():
         if version_dir.exists():
             target = version_dir / "RELEASE_NOTES.md"
             if not target.exists():
-                shutil.move(str(file), str(target))
+                _move(file, target)
                 print(f"Moved to version dir: {file.name} -> {target}")
             else:
                 # Remove duplicate
@@ -88,13 +102,14 @@ def cleanup_release_notes():
 
 def cleanup_old_files():
     """Remove files older than KEEP_DAYS from the archive."""
-    cutoff = datetime.now() - timedelta(days=KEEP_DAYS)
+    cutoff = (datetime.now() - timedelta(days=KEEP_DAYS)).timestamp()
 
-    for file in ARCHIVE_DIR.glob("*.json"):
-        mtime = datetime.fromtimestamp(file.stat().st_mtime)
-        if mtime < cutoff:
-            file.unlink()
-            print(f"Removed old file: {file.name}")
+    # scandir entries carry their stat result, so each file costs one stat at most
+    with os.scandir(ARCHIVE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                print(f"Removed old file: {entry.name}")
 
 
 def cleanup_release_directories():
@@ -103,17 +118,18 @@ def cleanup_release_directories():
 
     # Get all version directories and sort them by version
     version_dirs = []
-    for d in RELEASES_DIR.iterdir():
-        if not d.is_dir():
-            continue
-
-        # Handle both vX.Y.Z and X.Y.Z formats
-        version_str = d.name[1:] if d.name.startswith("v") else d.name
-        try:
-            version = tuple(map(int, version_str.split(".")))
-            version_dirs.append((version, d))
-        except (ValueError, AttributeError):
-            continue
+    with os.scandir(RELEASES_DIR) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+
+            # Handle both vX.Y.Z and X.Y.Z formats
+            version_str = entry.name[1:] if entry.name.startswith("v") else entry.name
+            try:
+                version = tuple(map(int, version_str.split(".")))
+                version_dirs.append((version, Path(entry.path)))
+            except (ValueError, AttributeError):
+                continue
 
     # Sort by version (newest first)
     version_dirs.sort(reverse=True, key=lambda x: x[0])
@@ -124,7 +140,7 @@ def cleanup_release_directories():
         archive_path = ARCHIVE_DIR / f"release_{'.'.join(map(str, version))}"
         if archive_path.exists():
             shutil.rmtree(str(archive_path))
-        shutil.move(str(dir_path), str(archive_path))
+        _move(dir_path, archive_path)
         print(f"Archived old release: {dir_path.name} -> {archive_path}")
 
         # Remove any corresponding release notes in the root
@@ -6,15 +6,16 @@ Replaces bump_version.py and update_version.sh.
 """
 
 import argparse
+import functools
+import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
-import tomli
-import tomli_w
-
 # Project paths
 # This file lives at <repo>/scripts/lib/version/version.py, so the repo root is
 # three levels up. (parent.parent resolved to <repo>/scripts/lib, which made
@@ -24,6 +25,10 @@ PYPROJECT_PATH = ROOT_DIR / "pyproject.toml"
 CHANGELOG_PATH = ROOT_DIR / "CHANGELOG.md"
 VERSION_FILE = ROOT_DIR / "evoseal" / "__init__.py"
 
+_VERSION_LINE_RE = re.compile(r'^version\s*=\s*"([\d.]+[\w.-]*)"', re.M)
+_VERSION_STRICT_RE = re.compile(r"^\d+\.\d+\.\d+$")
+_VERSION_UPDATE_RE = re.compile(r'^(version\s*=\s*")[^"]*(")', re.M)
+
 # ANSI colors
 RED = "\033[0;31m"
 GREEN = "\033[0;32m"
@@ -40,6 +45,10 @@ def print_success(msg: str) -> None:
     print(f"{GREEN}[SUCCESS]{NC} {msg}")
 
 
+def print_warning(msg: str) -> None:
+    print(f"{YELLOW}[WARNING]{NC} {msg}")
+
+
 def print_error(msg: str) -> None:
     print(f"{RED}[ERROR]{NC} {msg}", file=sys.stderr)
     sys.exit(1)
@@ -50,17 +59,36 @@ def run_cmd(cmd: list[str], cwd: Path | None = None) -> tuple[int, str]:
         result = subprocess.run(
             cmd, cwd=cwd or ROOT_DIR, capture_output=True, text=True, check=False
         )
-        return result.returncode, result.stdout.strip()
+        output = result.stdout if result.returncode == 0 else result.stderr or result.stdout
+        return result.returncode, output.strip()
     except Exception as e:
         return 1, str(e)
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_pyproject(path: Path, mtime_ns: int) -> tuple[str, str | None]:
+    content = path.read_text()
+    match = _VERSION_LINE_RE.search(content)
+    return content, match.group(1) if match else None
+
+
+def read_pyproject() -> tuple[str, str | None]:
+    """Return the pyproject.toml text and its project version.
+
+    The file is read once and the version is pulled out with a line regex rather
+    than a full TOML parse; the result is cached until the file's mtime changes.
+    """
+    return _parse_pyproject(PYPROJECT_PATH, PYPROJECT_PATH.stat().st_mtime_ns)
+
+
 def get_current_version() -> str:
     try:
-        with open(PYPROJECT_PATH, "rb") as f:
-            return tomli.load(f)["project"]["version"]
+        version = read_pyproject()[1]
     except Exception as e:
         print_error(f"Failed to get version: {e}")
+    if version is None:
+        print_error("Failed to get version: no version entry in pyproject.toml")
+    return version
 
 
 def bump_version(version: str, bump_type: str) -> str:
@@ -72,7 +100,7 @@ def bump_version(version: str, bump_type: str) -> str:
             return f"{major}.{minor + 1}.0"
         elif bump_type == "patch":
             return f"{major}.{minor}.{patch + 1}"
-        elif re.match(r"^\d+\.\d+\.\d+$", bump_type):
+        elif _VERSION_STRICT_RE.match(bump_type):
             return bump_type
         raise ValueError(f"Invalid version: {bump_type}")
     except Exception as e:
@@ -81,46 +109,92 @@ def bump_version(version: str, bump_type: str) -> str:
 
 def update_pyproject(version: str) -> None:
     try:
-        with open(PYPROJECT_PATH, "rb") as f:
-            pyproject = tomli.load(f)
-        pyproject["project"]["version"] = version
-        with open(PYPROJECT_PATH, "wb") as f:
-            tomli_w.dump(pyproject, f)
+        content, _ = read_pyproject()
+        updated, count = _VERSION_UPDATE_RE.subn(rf"\g<1>{version}\g<2>", content, count=1)
+        if count == 0:
+            print_warning("No version entry found in pyproject.toml; leaving it unchanged")
+            return
+        PYPROJECT_PATH.write_text(updated)
         print_success(f"Updated pyproject.toml to {version}")
     except Exception as e:
         print_error(f"Failed to update pyproject.toml: {e}")
 
 
+def _prepend_changelog_section(new_section: str) -> None:
+    """Stream CHANGELOG.md into a sibling temp file with *new_section* after the header.
+
+    Only the lines up to the ``# Changelog`` header are inspected; the rest is
+    copied in buffered chunks, and the temp file atomically replaces the original.
+    """
+    with (
+        CHANGELOG_PATH.open(encoding="utf-8") as src,
+        tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=CHANGELOG_PATH.parent, delete=False
+        ) as dst,
+    ):
+        try:
+            for line in iter(src.readline, ""):
+                dst.write(line)
+                if line == "# Changelog\n":
+                    dst.write(f"\n{new_section}")
+                    # Drop the blank lines that separated the header from the old top entry
+                    line = src.readline()
+                    while line == "\n":
+                        line = src.readline()
+                    dst.write(line)
+                    break
+            else:
+                # No header: start over with one in front of the existing content
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+                dst.write(f"# Changelog\n\n{new_section}")
+            shutil.copyfileobj(src, dst)
+            dst.close()
+            shutil.copymode(CHANGELOG_PATH, dst.name)
+            os.replace(dst.name, CHANGELOG_PATH)
+        except BaseException:
+            os.unlink(dst.name)
+            raise
+
+
 def update_changelog(version: str) -> None:
     try:
         date = datetime.now().strftime("%Y-%m-%d")
-        content = CHANGELOG_PATH.read_text() if CHANGELOG_PATH.exists() else "# Changelog\n\n"
         new_section = f"## [{version}] - {date}\n\n* Initial release\n\n"
-        updated = content.replace("# Changelog\n", f"# Changelog\n\n{new_section}", 1)
-        CHANGELOG_PATH.write_text(updated)
+        if not CHANGELOG_PATH.exists():
+            CHANGELOG_PATH.write_text(f"# Changelog\n\n{new_section}", encoding="utf-8")
+        else:
+            _prepend_changelog_section(new_section)
         print_success(f"Updated CHANGELOG.md for {version}")
     except Exception as e:
         print_error(f"Failed to update CHANGELOG.md: {e}")
 
 
-def git_commit_and_tag(version: str, message: str = "") -> None:
-    try:
-        run_cmd(["git", "add", str(PYPROJECT_PATH), str(CHANGELOG_PATH), str(VERSION_FILE)])
-        msg = message or f"Bump version to {version}"
-        run_cmd(["git", "commit", "-m", msg])
-        run_cmd(["git", "tag", "-a", f"v{version}", "-m", f"Version {version}"])
-        print_success(f"Created git tag v{version}")
-    except Exception as e:
-        print_error(f"Git operation failed: {e}")
-
-
-def push_changes() -> None:
-    try:
-        run_cmd(["git", "push"])
-        run_cmd(["git", "push", "--tags"])
+def git_commit_and_tag(version: str, message: str = "", push: bool = False) -> None:
+    """Commit the version files, tag the release and optionally push it.
+
+    Each git command runs directly (no shell); the first one that fails stops
+    the release and is reported together with its own error output.
+    """
+    msg = message or f"Bump version to {version}"
+    commands = [
+        ["git", "add", str(PYPROJECT_PATH), str(CHANGELOG_PATH), str(VERSION_FILE)],
+        ["git", "commit", "-m", msg],
+        ["git", "tag", "-a", f"v{version}", "-m", f"Version {version}"],
+    ]
+    if push:
+        # One atomic push carries the branch and the new annotated release tag
+        commands.append(["git", "push", "--atomic", "--follow-tags"])
+
+    for command in commands:
+        code, output = run_cmd(command)
+        if code != 0:
+            print_error(f"Git operation failed: {' '.join(command[:2])}: {output}")
+
+    print_success(f"Created git tag v{version}")
+    if push:
         print_success("Pushed changes and tags to remote")
-    except Exception as e:
-        print_error(f"Failed to push: {e}")
 
 
 def handle_bump(args) -> None:
@@ -135,15 +209,13 @@ def handle_bump(args) -> None:
     update_changelog(new_version)
 
     if not args.no_commit:
-        git_commit_and_tag(new_version, args.message)
-        if args.push:
-            push_changes()
+        git_commit_and_tag(new_version, args.message, push=args.push)
 
     print_success(f"Updated to version {new_version}")
 
 
 def handle_update(args) -> None:
-    if not re.match(r"^\d+\.\d+\.\d+$", args.version):
+    if not _VERSION_STRICT_RE.match(args.version):
         print_error("Version must be X.Y.Z")
 
     if args.dry_run:
@@ -154,9 +226,7 @@ def handle_update(args) -> None:
     update_changelog(args.version)
 
     if not args.no_commit:
-        git_commit_and_tag(args.version, args.message)
-        if args.push:
-            push_changes()
+        git_commit_and_tag(args.version, args.message, push=args.push)
 
     print_success(f"Updated to version {args.version}")
 
@@ -0,0 +1,202 @@
+"""Unit tests for ExperimentIntegration metric tracking."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from evoseal.core.experiment_integration import ExperimentIntegration, PerfRow
+from evoseal.core.version_tracker import VersionTracker
+from evoseal.models.experiment import MetricType
+
+
+@pytest.fixture
+def integration(tmp_path: Path) -> ExperimentIntegration:
+    tracker = VersionTracker(tmp_path)
+    integration = ExperimentIntegration(tracker)
+    integration.create_evolution_experiment(name="test", config={"population_size": 4})
+    integration.start_evolution_experiment()
+    return integration
+
+
+class TestTrackIteration:
+    """Tests for the combined track_iteration helper."""
+
+    def test_records_fitness_and_performance_metrics(
+        self, integration: ExperimentIntegration
+    ) -> None:
+        integration.track_iteration(
+            iteration=2,
+            fitness_scores=[0.2, 0.4],
+            best_fitness=0.4,
+            performance_metrics={"execution_time": 1.5, "memory_usage": 64.0},
+            diversity=2,
+        )
+
+        metrics = {m.name: m for m in integration.current_experiment.metrics}
+        assert metrics["iteration_completed"].value == 2
+        assert metrics["population_fitness_avg"].value == pytest.approx(0.3)
+        assert metrics["best_fitness"].value == 0.4
+        assert metrics["diversity"].value == 2
+        assert metrics["execution_time"].metric_type == MetricType.EXECUTION_TIME
+        assert metrics["execution_time"].iteration == 2
+        assert metrics["memory_usage"].metric_type == MetricType.MEMORY_USAGE
+
+    def test_saves_experiment_once(self, integration: ExperimentIntegration) -> None:
+        experiment_db = integration.version_tracker.experiment_db
+        with patch.object(experiment_db, "save_experiment") as save:
+            integration.track_iteration(
+                iteration=1,
+                fitness_scores=[0.1],
+                performance_metrics={"cpu_usage": 10.0},
+            )
+        save.assert_called_once()
+
+
+class TestAddArtifacts:
+    """Tests for batched artifact registration."""
+
+    def test_adds_all_artifacts_with_one_save(self, integration: ExperimentIntegration) -> None:
+        experiment_db = integration.version_tracker.experiment_db
+        with patch.object(experiment_db, "save_experiment") as save:
+            artifact_ids = integration.add_artifacts(
+                [
+                    {"name": "population", "artifact_type": "data", "content": "[]"},
+                    {"name": "log", "artifact_type": "log", "content": "done", "final": 1.0},
+                ]
+            )
+        save.assert_called_once()
+
+        artifacts = integration.current_experiment.artifacts
+        assert [a.id for a in artifacts] == artifact_ids
+        assert [a.name for a in artifacts] == ["population", "log"]
+        assert artifacts[1].metadata == {"final": 1.0}
+
+    def test_returns_empty_without_current_experiment(self, tmp_path: Path) -> None:
+        integration = ExperimentIntegration(VersionTracker(tmp_path))
+        assert integration.add_artifacts([{"name": "a", "artifact_type": "data"}]) == []
+
+
+class TestCheckpointIndex:
+    """Tests for the SQLite-backed checkpoint index."""
+
+    def test_created_checkpoints_are_listed(self, integration: ExperimentIntegration) -> None:
+        tracker = integration.version_tracker
+        first = integration.create_checkpoint("iteration_3")
+        second = integration.create_checkpoint("iteration_6")
+
+        checkpoints = tracker.list_checkpoints(integration.current_experiment.id)
+        assert [c["id"] for c in checkpoints] == [first, second]
+        assert checkpoints[0]["name"] == "iteration_3"
+        assert Path(checkpoints[0]["path"]) == tracker.checkpoints_dir / first
+        assert tracker.list_checkpoints("missing") == []
+
+
+class TestExperimentSummaryCache:
+    """Tests for cached summaries of finished experiments."""
+
+    def test_finished_summary_is_cached(self, integration: ExperimentIntegration) -> None:
+        experiment_id = integration.current_experiment.id
+        integration.complete_evolution_experiment()
+
+        experiment_db = integration.version_tracker.experiment_db
+        get_experiment = experiment_db.get_experiment
+        with patch.object(experiment_db, "get_experiment", wraps=get_experiment) as get:
+            first = integration.get_experiment_summary(experiment_id)
+            second = integration.get_experiment_summary(experiment_id)
+        assert get.call_count == 1
+        assert second == first
+        assert first["status"] == "completed"
+
+    def test_cached_summary_is_a_copy(self, integration: ExperimentIntegration) -> None:
+        experiment_id = integration.current_experiment.id
+        integration.complete_evolution_experiment()
+
+        integration.get_experiment_summary(experiment_id)["latest_metrics"]["x"] = 1
+        assert "x" not in integration.get_experiment_summary(experiment_id)["latest_metrics"]
+
+    def test_update_by_another_writer_invalidates_summary(
+        self, integration: ExperimentIntegration
+    ) -> None:
+        experiment_id = integration.current_experiment.id
+        integration.complete_evolution_experiment()
+        assert integration.get_experiment_summary(experiment_id)["latest_metrics"] == {}
+
+        # A second integration sharing the database updates the stored experiment
+        other = ExperimentIntegration(integration.version_tracker)
+        experiment = other.version_tracker.experiment_db.get_experiment(experiment_id)
+        experiment.add_metric("best_fitness", 0.9, MetricType.CUSTOM)
+        other.version_tracker.experiment_db.save_experiment(experiment)
+
+        summary = integration.get_experiment_summary(experiment_id)
+        assert summary["latest_metrics"]["best_fitness"] == 0.9
+
+    def test_readded_variant_invalidates_summary(self, integration: ExperimentIntegration) -> None:
+        experiment_id = integration.current_experiment.id
+        version_db = integration.version_tracker.version_db
+        version_db.add_variant("v1", "x = 1", {}, 0.2, experiment_id=experiment_id)
+        integration.complete_evolution_experiment()
+        assert integration.get_experiment_summary(experiment_id)["variant_statistics"][
+            "best_score"
+        ] == pytest.approx(0.2)
+
+        # Same variant id, same count, new score
+        version_db.add_variant("v1", "x = 2", {}, 0.8, experiment_id=experiment_id)
+
+        summary = integration.get_experiment_summary(experiment_id)
+        assert summary["variant_statistics"]["best_score"] == pytest.approx(0.8)
+
+    def test_running_summary_is_not_cached(self, integration: ExperimentIntegration) -> None:
+        experiment_id = integration.current_experiment.id
+        integration.get_experiment_summary(experiment_id)
+        integration.track_iteration(iteration=1, best_fitness=0.5)
+
+        summary = integration.get_experiment_summary(experiment_id)
+        assert summary["latest_metrics"]["best_fitness"] == 0.5
+
+
+class TestAflush:
+    """Tests for running tracking writes in the background flush thread."""
+
+    @pytest.mark.asyncio
+    async def test_runs_call_off_loop_and_returns_result(
+        self, integration: ExperimentIntegration
+    ) -> None:
+        artifact_ids = await integration.aflush(
+            integration.add_artifacts, [{"name": "log", "artifact_type": "log", "content": "x"}]
+        )
+        integration.close()
+
+        assert integration.current_experiment.artifacts[0].id == artifact_ids[0]
+        saved = integration.version_tracker.experiment_db.get_experiment(
+            integration.current_experiment.id
+        )
+        assert [a.name for a in saved.artifacts] == ["log"]
+
+
+class TestTrackPerformanceMetricsBulk:
+    """Tests for recording a run's performance metrics in one call."""
+
+    def test_records_rows_per_iteration_with_one_save(
+        self, integration: ExperimentIntegration
+    ) -> None:
+        rows = [PerfRow(1.0, 64.0, 20.0), PerfRow(2.0, 128.0, 40.0)]
+        experiment_db = integration.version_tracker.experiment_db
+        with patch.object(experiment_db, "save_experiment") as save:
+            integration.track_performance_metrics_bulk(rows, start_iteration=3)
+        save.assert_called_once()
+
+        metrics = integration.current_experiment.metrics
+        assert [(m.name, m.iteration, m.value) for m in metrics] == [
+            ("execution_time", 3, 1.0),
+            ("memory_usage", 3, 64.0),
+            ("cpu_usage", 3, 20.0),
+            ("execution_time", 4, 2.0),
+            ("memory_usage", 4, 128.0),
+            ("cpu_usage", 4, 40.0),
+        ]
+        assert metrics[0].metric_type == MetricType.EXECUTION_TIME
+        assert metrics[1].metric_type == MetricType.MEMORY_USAGE
+        assert metrics[2].metric_type == MetricType.CUSTOM
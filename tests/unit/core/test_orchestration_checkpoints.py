@@ -0,0 +1,126 @@
+"""Tests for the workflow orchestration CheckpointManager."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from evoseal.core.orchestration import CheckpointManager, CheckpointType, ExecutionContext
+from evoseal.core.orchestration.types import OrchestrationState, StepResult
+
+
+@pytest.fixture
+def context() -> ExecutionContext:
+    return ExecutionContext(
+        workflow_id="wf",
+        experiment_id="exp",
+        start_time=datetime.utcnow(),
+        current_iteration=0,
+        current_stage="init",
+        total_iterations=3,
+        state=OrchestrationState.RUNNING,
+        checkpoint_interval=1,
+        last_checkpoint=None,
+    )
+
+
+def _result(step_id: str, value: int) -> StepResult:
+    return StepResult(
+        step_id=step_id,
+        name=step_id,
+        success=True,
+        execution_time=0.1,
+        retry_count=0,
+        result=value,
+    )
+
+
+async def _checkpoint(
+    manager: CheckpointManager, context: ExecutionContext, results: dict[str, StepResult]
+) -> str:
+    return await manager.create_checkpoint(
+        checkpoint_type=CheckpointType.AUTOMATIC,
+        execution_context=context,
+        workflow_steps=[],
+        step_results=results,
+        state=OrchestrationState.RUNNING,
+        resource_usage={},
+    )
+
+
+class TestDeltaCheckpoints:
+    """Tests for incremental step-result checkpoints."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_results_are_written(
+        self, tmp_path: Path, context: ExecutionContext
+    ) -> None:
+        manager = CheckpointManager(tmp_path)
+        first = await _checkpoint(manager, context, {"a": _result("a", 1), "b": _result("b", 1)})
+        second = await _checkpoint(manager, context, {"a": _result("a", 1), "b": _result("b", 2)})
+
+        raw = manager._load_checkpoint_files(second)
+        assert raw["metadata"]["base_checkpoint_id"] == first
+        assert set(raw["binary_data"]["step_results"]) == {"b"}
+
+        restored = manager.get_checkpoint(second)["binary_data"]["step_results"]
+        assert restored["a"].result == 1
+        assert restored["b"].result == 2
+
+    @pytest.mark.asyncio
+    async def test_full_snapshot_interval_bounds_the_chain(
+        self, tmp_path: Path, context: ExecutionContext
+    ) -> None:
+        manager = CheckpointManager(tmp_path, full_snapshot_interval=2)
+        ids = [await _checkpoint(manager, context, {"a": _result("a", i)}) for i in range(3)]
+
+        bases = [manager.checkpoints[cp].base_checkpoint_id for cp in ids]
+        assert bases == [None, ids[0], None]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_bases_of_kept_deltas(
+        self, tmp_path: Path, context: ExecutionContext
+    ) -> None:
+        manager = CheckpointManager(tmp_path)
+        base = await _checkpoint(manager, context, {"a": _result("a", 1)})
+        delta = await _checkpoint(manager, context, {"a": _result("a", 2)})
+        manager.checkpoints[delta].timestamp = datetime.max
+
+        manager.cleanup_old_checkpoints(max_count=1)
+
+        assert set(manager.checkpoints) == {base, delta}
+
+
+class TestBackgroundWrites:
+    """Tests for checkpoint files written off the workflow's critical path."""
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_readable_before_and_after_flush(
+        self, tmp_path: Path, context: ExecutionContext
+    ) -> None:
+        manager = CheckpointManager(tmp_path)
+        checkpoint_id = await _checkpoint(manager, context, {"a": _result("a", 1)})
+
+        pending = manager.get_checkpoint(checkpoint_id)
+        await manager.flush()
+
+        assert (tmp_path / f"{checkpoint_id}.json").exists()
+        assert (tmp_path / f"{checkpoint_id}.pkl").exists()
+        stored = manager.get_checkpoint(checkpoint_id)
+        assert stored["binary_data"]["step_results"]["a"].result == 1
+        assert pending["metadata"] == stored["metadata"]
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_deleted_before_write_leaves_no_files(
+        self, tmp_path: Path, context: ExecutionContext
+    ) -> None:
+        manager = CheckpointManager(tmp_path)
+        checkpoint_id = await _checkpoint(manager, context, {"a": _result("a", 1)})
+
+        assert manager.delete_checkpoint(checkpoint_id)
+        await manager.close()
+
+        assert not list(tmp_path.glob(f"{checkpoint_id}.*"))
@@ -0,0 +1,223 @@
+"""Unit tests for WorkflowOrchestrator step scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from evoseal.core.orchestration import ExecutionStrategy, ResourceMonitor, WorkflowOrchestrator
+
+
+class _Stage:
+    """Pipeline component that sleeps, then records when it finished."""
+
+    def __init__(self, name: str, delay: float, log: list[str], fail: bool = False) -> None:
+        self.name = name
+        self.delay = delay
+        self.log = log
+        self.fail = fail
+
+    async def run(self, **_: Any) -> str:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        self.log.append(self.name)
+        return self.name
+
+
+class _Pipeline:
+    def __init__(self, delays: dict[str, float], failing: tuple[str, ...] = ()) -> None:
+        self.log: list[str] = []
+        for name, delay in delays.items():
+            setattr(self, name, _Stage(name, delay, self.log, fail=name in failing))
+
+
+def _step(name: str, *deps: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "name": name,
+        "component": name,
+        "operation": "run",
+        "dependencies": list(deps),
+        "retry_count": 0,
+        **extra,
+    }
+
+
+async def _orchestrator(
+    tmp_path: Path, steps: list[dict[str, Any]], **kwargs: Any
+) -> WorkflowOrchestrator:
+    orchestrator = WorkflowOrchestrator(
+        workspace_dir=str(tmp_path / "ws"),
+        execution_strategy=ExecutionStrategy.PARALLEL,
+        **kwargs,
+    )
+    assert await orchestrator.initialize_workflow({"workflow_id": "wf", "steps": steps})
+    await orchestrator.resource_monitor.stop_monitoring()
+    return orchestrator
+
+
+class TestParallelScheduling:
+    """Tests for dependency-driven parallel step execution."""
+
+    @pytest.mark.asyncio
+    async def test_dependents_start_when_their_own_dependencies_finish(
+        self, tmp_path: Path
+    ) -> None:
+        # "quick_follow" only depends on "short", so it must not wait for "long".
+        steps = [_step("long"), _step("short"), _step("quick_follow", "short")]
+        orchestrator = await _orchestrator(tmp_path, steps)
+        pipeline = _Pipeline({"long": 0.2, "short": 0.01, "quick_follow": 0.01})
+
+        results = await orchestrator._execute_steps_parallel(pipeline)
+
+        assert pipeline.log == ["short", "quick_follow", "long"]
+        assert all(result.success for result in results.values())
+
+    @pytest.mark.asyncio
+    async def test_critical_failure_stops_scheduling_dependents(self, tmp_path: Path) -> None:
+        steps = [_step("analyze"), _step("generate", "analyze"), _step("other")]
+        orchestrator = await _orchestrator(tmp_path, steps)
+        pipeline = _Pipeline({"analyze": 0.01, "generate": 0.01, "other": 0.05}, ("analyze",))
+
+        results = await orchestrator._execute_steps_parallel(pipeline)
+
+        assert not results["analyze"].success
+        assert results["other"].success
+        assert "generate" not in results
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_runs_highest_fanout_first(self, tmp_path: Path) -> None:
+        steps = [
+            _step("leaf"),
+            _step("hub"),
+            _step("child", "hub"),
+            _step("grandchild", "child"),
+        ]
+        orchestrator = await _orchestrator(tmp_path, steps, max_concurrent_steps=1)
+        pipeline = _Pipeline({name: 0.01 for name in ("leaf", "hub", "child", "grandchild")})
+
+        await orchestrator._execute_steps_parallel(pipeline)
+
+        assert orchestrator._plan.fanout == {
+            "leaf": 0,
+            "hub": 2,
+            "child": 1,
+            "grandchild": 0,
+        }
+        assert pipeline.log == ["hub", "child", "leaf", "grandchild"]
+
+    @pytest.mark.asyncio
+    async def test_plan_is_compiled_once_per_workflow(self, tmp_path: Path) -> None:
+        steps = [_step("analyze"), _step("generate", "analyze")]
+        orchestrator = await _orchestrator(tmp_path, steps)
+        pipeline = _Pipeline({"analyze": 0.0, "generate": 0.0})
+
+        with patch("evoseal.core.orchestration.orchestrator._compile_plan") as compile_plan:
+            for _ in range(3):
+                await orchestrator._execute_steps_parallel(pipeline)
+                await orchestrator._execute_steps_sequential(pipeline)
+
+        compile_plan.assert_not_called()
+        assert orchestrator._plan.order == ["analyze", "generate"]
+        assert pipeline.log == ["analyze", "generate"] * 6
+
+    @pytest.mark.asyncio
+    async def test_call_operation_on_coroutine_method_is_awaited(self, tmp_path: Path) -> None:
+        class Pipeline:
+            async def analyze(self) -> str:
+                await asyncio.sleep(0)
+                return "done"
+
+        step = {**_step("analyze"), "component": "analyze", "operation": "__call__"}
+        orchestrator = await _orchestrator(tmp_path, [step])
+
+        results = await orchestrator._execute_steps_parallel(Pipeline())
+
+        assert results["analyze"].result == "done"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_step_ids_are_rejected(self, tmp_path: Path) -> None:
+        orchestrator = WorkflowOrchestrator(workspace_dir=str(tmp_path / "ws"))
+
+        steps = [_step("analyze"), _step("analyze")]
+        assert not await orchestrator.initialize_workflow({"steps": steps})
+
+        # Same name is fine as long as the explicit step ids differ
+        steps = [_step("analyze", step_id="a1"), _step("analyze", step_id="a2")]
+        assert await orchestrator.initialize_workflow({"steps": steps})
+        await orchestrator.resource_monitor.stop_monitoring()
+        assert orchestrator._plan.order == ["a1", "a2"]
+
+
+class TestStepCache:
+    """Tests for memoized cacheable steps."""
+
+    @pytest.mark.asyncio
+    async def test_cacheable_step_runs_once_per_parameter_set(self, tmp_path: Path) -> None:
+        steps = [_step("analyze", cacheable=True), _step("generate")]
+        orchestrator = await _orchestrator(tmp_path, steps)
+        pipeline = _Pipeline({"analyze": 0.0, "generate": 0.0})
+
+        for _ in range(3):
+            results = await orchestrator._execute_steps_sequential(pipeline)
+
+        assert pipeline.log == ["analyze", "generate", "generate", "generate"]
+        assert results["analyze"].result == "analyze"
+
+        orchestrator._plan.steps["analyze"].parameters = {"depth": 2}
+        await orchestrator._execute_steps_sequential(pipeline)
+        assert pipeline.log.count("analyze") == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_scoped_to_pipeline_and_workflow(self, tmp_path: Path) -> None:
+        steps = [_step("analyze", cacheable=True)]
+        orchestrator = await _orchestrator(tmp_path, steps)
+        pipeline = _Pipeline({"analyze": 0.0})
+        other_pipeline = _Pipeline({"analyze": 0.0})
+
+        await orchestrator._execute_steps_sequential(pipeline)
+        await orchestrator._execute_steps_sequential(other_pipeline)
+        assert other_pipeline.log == ["analyze"]
+
+        # Loading a workflow (even the same one again) starts with an empty cache
+        assert await orchestrator.initialize_workflow({"workflow_id": "wf", "steps": steps})
+        await orchestrator.resource_monitor.stop_monitoring()
+        await orchestrator._execute_steps_sequential(pipeline)
+        assert pipeline.log == ["analyze", "analyze"]
+
+
+class TestSharedResourceMonitor:
+    """Tests for orchestrators sharing an injected ResourceMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_injected_monitor_is_subscribed_not_started(self, tmp_path: Path) -> None:
+        monitor = ResourceMonitor()
+        orchestrator = WorkflowOrchestrator(
+            workspace_dir=str(tmp_path / "ws"), resource_monitor=monitor
+        )
+        assert orchestrator.resource_monitor is monitor
+        assert monitor.alert_callbacks == []
+
+        assert await orchestrator.initialize_workflow({"steps": [_step("analyze")]})
+        assert not monitor._monitoring_active
+        assert monitor.alert_callbacks == [orchestrator._on_resource_alert]
+
+        await orchestrator._stop_resource_monitoring()
+        assert monitor.alert_callbacks == []
+
+
+class TestClock:
+    """Tests for the injectable orchestrator clock."""
+
+    @pytest.mark.asyncio
+    async def test_step_times_come_from_injected_clock(self, tmp_path: Path) -> None:
+        ticks = iter(range(0, 1000, 10))
+        orchestrator = await _orchestrator(tmp_path, [_step("analyze")], clock=lambda: next(ticks))
+
+        results = await orchestrator._execute_steps_sequential(_Pipeline({"analyze": 0.0}))
+
+        assert results["analyze"].execution_time == 10
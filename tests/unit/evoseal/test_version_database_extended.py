@@ -7,6 +7,7 @@ and edge cases not covered by the original test_version_database.py.
 from __future__ import annotations
 
 import json
+from datetime import datetime
 
 import pytest
 
@@ -300,3 +301,43 @@ def test_get_lineage_nonexistent():
 def test_get_variant_nonexistent():
     db = VersionDatabase()
     assert db.get_variant("missing") is None
+
+
+def test_export_variants_without_orjson(monkeypatch):
+    from evoseal.core import version_database
+
+    monkeypatch.setattr(version_database, "orjson", None)
+    db = VersionDatabase()
+    db.add_variant("v1", "code", {}, 0.8)
+    json_str = db.export_variants()
+    assert ", " not in json_str
+    assert json.loads(json_str)["variants"]["v1"]["eval_score"] == 0.8
+
+
+def test_export_variants_same_with_and_without_orjson(monkeypatch):
+    from evoseal.core import version_database
+
+    pytest.importorskip("orjson")
+    db = VersionDatabase()
+    metadata = {1: "int key", "when": datetime(2026, 10, 16, 10, 0, 0)}
+    db.add_variant("v1", "code", {}, 0.8, metadata=metadata)
+
+    with_orjson = json.loads(db.export_variants())["variants"]
+    monkeypatch.setattr(version_database, "orjson", None)
+    without_orjson = json.loads(db.export_variants())["variants"]
+
+    assert with_orjson == without_orjson
+    assert without_orjson["v1"]["metadata"] == {"1": "int key", "when": "2026-10-16T10:00:00"}
+
+
+def test_get_variant_statistics_by_experiment_after_readd():
+    db = VersionDatabase()
+    db.add_variant("v1", "code", {}, 0.2, experiment_id="exp1")
+    db.add_variant("v2", "code", {}, 0.4, experiment_id="exp1")
+    db.add_variant("v1", "code", {}, 0.9, experiment_id="exp1")
+    db.add_variant("v2", "code", {}, 0.6, experiment_id="exp2")
+
+    stats = db.get_variant_statistics(experiment_id="exp1")
+    assert stats["total_variants"] == 1
+    assert stats["best_score"] == stats["worst_score"] == 0.9
+    assert db.get_variant_statistics(experiment_id="exp2")["average_score"] == 0.6
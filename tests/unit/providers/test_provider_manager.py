@@ -317,3 +317,28 @@ class TestAListProviders:
             mock_settings.seal.providers = mock_cfg
             result = await mgr.alist_providers(health_check_timeout=0.1)
         assert result["slow"]["healthy"] is False
+
+    @pytest.mark.asyncio
+    async def test_health_checks_run_concurrently(self):
+        running = 0
+        peak = 0
+
+        async def slow_check():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        providers = {name: _make_provider(True) for name in ("a", "b", "c")}
+        for provider in providers.values():
+            provider.health_check = AsyncMock(side_effect=slow_check)
+        mgr, mock_cfg = _make_manager_with_providers(
+            {name: (provider, 1) for name, provider in providers.items()}
+        )
+        with patch("evoseal.providers.provider_manager.settings") as mock_settings:
+            mock_settings.seal.providers = mock_cfg
+            result = await mgr.alist_providers()
+        assert peak == 3
+        assert [info["healthy"] for info in result.values()] == [True, True, True]
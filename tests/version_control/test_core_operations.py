@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from evoseal.utils.version_control.cmd_git import CmdGit
+from evoseal.utils.version_control.version_manager import VersionManager
 
 
 def test_initialize_new_repo(temp_dir: Path):
@@ -359,3 +360,18 @@ def test_branch_operations(git_repo_with_commit: CmdGit):
     result = git_repo_with_commit.branch()
     assert result.success
     assert "feature-branch" not in result.output
+
+
+def test_version_manager_commit_history(git_repo_with_commit: CmdGit):
+    """Test parsing commit history from a single formatted git log call."""
+    (git_repo_with_commit.repo_path / "file.txt").write_text("content")
+    git_repo_with_commit._run_git_command(["add", "file.txt"])
+    git_repo_with_commit._run_git_command(["commit", "-m", "Add file: with separators\tin it"])
+
+    vm = VersionManager(git_repo_with_commit.repo_path, git_repo_with_commit)
+    commits = vm.get_commit_history(limit=5)
+
+    assert [c.message for c in commits] == ["Add file: with separators\tin it", "Initial commit"]
+    assert commits[0].author.endswith(">")
+    assert len(commits[0].hash) == 40
+    assert commits[0].date is not None